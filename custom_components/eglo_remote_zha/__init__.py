@@ -7,54 +7,115 @@ ERCU_3groups_Zm remote control, enabling:
 - Universal device control (any HA protocol: Zigbee, WiFi, Thread, BLE, RF, etc.)
 - Long press support for applicable buttons
 
-The quirks are automatically registered with ZHA when this integration loads.
-Persistent state storage is handled via Home Assistant's Store class.
+The quirks are registered with zigpy when this package is imported, before
+ZHA builds its devices (see quirk_loader.py). Persistent state storage is
+handled via Home Assistant's Store class.
 """
 
 import logging
+import sys
+import time
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+
+from .const import (
+    BANK_GROUP_IDS,
+    BANK_QUIRK_MODULE,
+    DEFAULT_FRAME_TRACE_SIZE,
+    DOMAIN,
+    EVENT_READY,
+    QUEUE_POLICIES,
+    SERVICE_BIND_BANKS,
+    SERVICE_BLINK,
+    SERVICE_FRAME_TRACE,
+    SERVICE_GET_AREA_LIGHTS,
+    SERVICE_GET_METRICS,
+    SERVICE_GET_STATE,
+    SERVICE_GET_STATES,
+    SERVICE_REGISTER_GROUP_REMOTE,
+    SERVICE_REGISTER_REMOTE,
+    SERVICE_SET_STATE,
+    SERVICE_UNBIND_BANKS,
+    SERVICE_UNREGISTER_GROUP_REMOTE,
+    SERVICE_UNREGISTER_REMOTE,
+    SERVICE_UPDATE_STATE,
+    TIERS,
+)
+from .area_index import AreaLightIndex
+from .bank_binding import async_bind_bank, async_unbind_bank
+from .capabilities import LightCapabilityIndex
+from .command_slot import LightCommandSlots
+from .controller import (
+    DEFAULT_COALESCE_MS,
+    DEFAULT_QUEUE_POLICY,
+    DEFAULT_QUEUE_SIZE,
+    RemoteConfig,
+    RemoteController,
+)
+from .dispatch import ActionDispatcher
+from .feedback import BlinkScheduler
+from .group_cast import GroupCaster
+from .group_remote import (
+    DEFAULT_BRIGHTNESS_STEP,
+    GroupRemoteConfig,
+    GroupRemoteController,
+)
+from .metrics import PressMetrics
+from .quirk_loader import IMPORT_MS, import_quirks
+from .ramp import RampEngine
+from .storage import RemoteStateStore
 
 _LOGGER = logging.getLogger(__name__)
 
-# Import quirk classes so they're registered with zigpy/ZHA
-# These imports happen at module load time, before async_setup_entry is called
-# When Python executes these imports, the CustomDevice classes are defined
-# and automatically registered with zigpy's DEVICE_REGISTRY
-try:
-    from .eglo_ercu_3groups import EgloERCU3Groups
-    # Use basic Awox quirk - provides standard triggers without bank suffixes
-    # Area/light selection is handled by blueprints with persistent storage
-    from .eglo_ercu_awox import Awox99099Remote
-    
-    _LOGGER.debug(
-        "Eglo Remote ZHA quirks imported successfully: "
-        "Awox99099Remote (simplified), EgloERCU3Groups"
-    )
-except ImportError as err:
-    _LOGGER.error(
-        "Failed to import Eglo Remote ZHA quirks. This usually means zigpy is not "
-        "installed or ZHA is not enabled. Error: %s", err
-    )
-    raise
-except Exception as err:
-    _LOGGER.error(
-        "Unexpected error loading Eglo Remote ZHA quirks: %s", err
-    )
-    raise
+# Register the quirks with zigpy/ZHA at import time, so ZHA finds them when
+# it creates the devices (before async_setup_entry is called)
+import_quirks()
+
+PLATFORMS = [Platform.SENSOR]
 
-__all__ = ["EgloERCU3Groups", "Awox99099Remote"]
+UNBIND_BANKS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("banks", default=[]): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(int), vol.In(BANK_GROUP_IDS))]
+        ),
+    }
+)
 
-DOMAIN = "eglo_remote_zha"
-STORAGE_VERSION = 1
-STORAGE_KEY = "eglo_remote_zha_state"
 
-# Service names
-SERVICE_SET_STATE = "set_state"
-SERVICE_GET_STATE = "get_state"
+def _as_list(value: Any) -> list[Any]:
+    """Normalize a single value or a list of values to a list."""
+    if value is None or value == "":
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+def _unknown_devices(hass: HomeAssistant, device_ids: list[Any]) -> list[Any]:
+    """Return the device_ids that are not in the device registry.
+
+    Device ids name the per-remote storage files, so only registered devices
+    may reach the store.
+    """
+    dev_reg = dr.async_get(hass)
+    return [
+        device_id
+        for device_id in device_ids
+        if not isinstance(device_id, str) or dev_reg.async_get(device_id) is None
+    ]
+
+
+def _target_entities(value: Any) -> list[str]:
+    """Return the entity_ids of a target selector value or an entity list."""
+    if isinstance(value, dict):
+        return _as_list(value.get("entity_id"))
+    return _as_list(value)
 
 
 async def async_setup(hass: HomeAssistant, config: dict):
@@ -64,30 +125,68 @@ async def async_setup(hass: HomeAssistant, config: dict):
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Eglo Remote ZHA from a config entry."""
+    setup_start = time.perf_counter()
+    hass.data.setdefault(DOMAIN, {})
     
-    # Initialize persistent storage
-    store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
-    
-    # Load existing state or initialize empty dict
-    stored_data = await store.async_load() or {}
+    # Initialize persistent storage (write-behind, debounced saves)
+    # Each remote's state is loaded on first access
+    store = RemoteStateStore(hass)
+    await store.async_load()
+    stored_data = store.data
     
     # Store in hass.data for access by blueprints/automations
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN]["store"] = store
     hass.data[DOMAIN]["state"] = stored_data
     
-    _LOGGER.info(
-        "Eglo Remote ZHA integration enabled - ZHA quirks are active for: "
-        "AwoX ERCU_3groups_Zm (99099), Tuya TS004F (_TZ3000_4fjiwweb)"
-    )
-    _LOGGER.info(
-        "When you pair an Eglo remote via ZHA, the custom quirk will be "
-        "automatically applied based on the device signature"
-    )
-    _LOGGER.info(
-        "Persistent state storage initialized - %d remote(s) configured",
-        len(stored_data)
+    # One zha_event listener resolves presses of all AwoX remotes
+    press_metrics = PressMetrics()
+    hass.data[DOMAIN]["press_metrics"] = press_metrics
+    dispatcher = ActionDispatcher(hass, press_metrics)
+    dispatcher.async_start()
+    hass.data[DOMAIN]["dispatcher"] = dispatcher
+    
+    # Area -> lights index, kept current from registry updates
+    area_index = AreaLightIndex(hass)
+    area_index.async_start()
+    hass.data[DOMAIN]["area_index"] = area_index
+    
+    # Light capabilities, kept current from state changes
+    capabilities = LightCapabilityIndex(hass)
+    capabilities.async_start()
+    hass.data[DOMAIN]["capabilities"] = capabilities
+    
+    # Send multi-light commands as one ZHA group-cast where possible
+    group_caster = GroupCaster(hass, area_index)
+    await group_caster.async_start()
+    hass.data[DOMAIN]["group_caster"] = group_caster
+    
+    # Selection feedback, coalesced per remote and restoring the lights
+    feedback = BlinkScheduler(hass, group_caster)
+    hass.data[DOMAIN]["feedback"] = feedback
+    
+    # Latest-wins light commands per target
+    commands = LightCommandSlots(hass, press_metrics)
+    hass.data[DOMAIN]["commands"] = commands
+    
+    # Native press handling for remotes registered via register_remote
+    controller = RemoteController(
+        hass,
+        store,
+        dispatcher,
+        area_index,
+        group_caster,
+        feedback,
+        press_metrics,
+        capabilities,
+        commands,
     )
+    controller.async_start()
+    hass.data[DOMAIN]["controller"] = controller
+    
+    # Native switching and hold-to-dim for 3-group (TS004F) remotes
+    group_remotes = GroupRemoteController(hass, RampEngine(hass))
+    group_remotes.async_start()
+    hass.data[DOMAIN]["group_remotes"] = group_remotes
     
     # Register services for state management
     async def handle_set_state(call: ServiceCall) -> None:
@@ -95,20 +194,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         device_id = call.data.get("device_id")
         key = call.data.get("key")
         value = call.data.get("value")
+        tier = call.data.get("tier")
         
         if not device_id or not key:
             _LOGGER.error("set_state requires device_id and key parameters")
             return
+        if _unknown_devices(hass, [device_id]):
+            _LOGGER.error("set_state: unknown device %s", device_id)
+            return
+        if tier is not None and tier not in TIERS:
+            _LOGGER.error("set_state: tier must be one of %s", ", ".join(TIERS))
+            return
         
-        # Ensure device entry exists
-        if device_id not in hass.data[DOMAIN]["state"]:
-            hass.data[DOMAIN]["state"][device_id] = {}
-        
-        # Set the value
-        hass.data[DOMAIN]["state"][device_id][key] = value
-        
-        # Persist to disk
-        await hass.data[DOMAIN]["store"].async_save(hass.data[DOMAIN]["state"])
+        # Set the value in memory; the store coalesces the disk write
+        store = hass.data[DOMAIN]["store"]
+        if tier is not None:
+            store.async_set_tier(key, tier)
+        await store.async_load_remote(device_id)
+        try:
+            store.async_set(device_id, key, value)
+        except vol.Invalid as err:
+            _LOGGER.error("set_state: invalid %s for %s: %s", key, device_id, err)
+            return
         
         _LOGGER.debug("State updated for %s: %s = %s", device_id, key, value)
     
@@ -121,15 +228,247 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if not device_id:
             _LOGGER.error("get_state requires device_id parameter")
             return {"value": default}
+        if _unknown_devices(hass, [device_id]):
+            _LOGGER.error("get_state: unknown device %s", device_id)
+            return {"value": default}
         
-        device_state = hass.data[DOMAIN]["state"].get(device_id, {})
+        device_state = await hass.data[DOMAIN]["store"].async_load_remote(device_id)
         
         if key:
-            value = device_state.get(key, default)
-        else:
-            value = device_state
+            return {
+                "value": device_state.get(key, default),
+                "tier": hass.data[DOMAIN]["store"].tier(key),
+            }
+        
+        return {"value": device_state}
+    
+    async def handle_update_state(call: ServiceCall) -> None:
+        """Handle update_state service call (several keys, one or more remotes)."""
+        device_ids = _as_list(call.data.get("device_id"))
+        values = call.data.get("values")
+        tiers = call.data.get("tiers") or {}
+        
+        if not device_ids or not isinstance(values, dict) or not values:
+            _LOGGER.error("update_state requires device_id and a values mapping")
+            return
+        if unknown := _unknown_devices(hass, device_ids):
+            _LOGGER.error("update_state: unknown device(s) %s", unknown)
+            return
+        if not isinstance(tiers, dict) or not set(tiers.values()) <= set(TIERS):
+            _LOGGER.error(
+                "update_state: tiers must map keys to one of %s", ", ".join(TIERS)
+            )
+            return
+        
+        store = hass.data[DOMAIN]["store"]
+        for key, tier in tiers.items():
+            store.async_set_tier(key, tier)
+        for device_id in device_ids:
+            await store.async_load_remote(device_id)
+        
+        # Applied synchronously in the event loop, so no other service call
+        # can observe a partially updated remote. Values are validated by the
+        # store, the same way for every remote, so an invalid value is
+        # rejected at the first remote before anything changes
+        try:
+            for device_id in device_ids:
+                store.async_update(device_id, values)
+        except vol.Invalid as err:
+            _LOGGER.error("update_state: invalid values for %s: %s", device_ids, err)
+            return
+        
+        _LOGGER.debug("State updated for %s: %s", device_ids, values)
+    
+    async def handle_get_states(call: ServiceCall) -> dict[str, Any]:
+        """Handle get_states service call (several keys, one or more remotes)."""
+        device_ids = _as_list(call.data.get("device_id"))
+        keys = _as_list(call.data.get("keys"))
+        defaults = call.data.get("defaults") or {}
+        
+        if not device_ids:
+            _LOGGER.error("get_states requires device_id parameter")
+            return {"devices": {}, "values": dict(defaults)}
+        if unknown := _unknown_devices(hass, device_ids):
+            _LOGGER.error("get_states: unknown device(s) %s", unknown)
+            return {"devices": {}, "values": dict(defaults)}
+        
+        store = hass.data[DOMAIN]["store"]
+        devices: dict[str, dict[str, Any]] = {}
+        for device_id in device_ids:
+            device_state = await store.async_load_remote(device_id)
+            if keys:
+                devices[device_id] = {
+                    key: device_state.get(key, defaults.get(key)) for key in keys
+                }
+            else:
+                devices[device_id] = {**defaults, **device_state}
         
-        return {"value": value}
+        response: dict[str, Any] = {"devices": devices}
+        if len(device_ids) == 1:
+            # Convenience for the common single-remote case
+            response["values"] = devices[device_ids[0]]
+        return response
+    
+    async def handle_register_remote(call: ServiceCall) -> None:
+        """Handle register_remote service call."""
+        device_id = call.data.get("device_id")
+        
+        if not device_id:
+            _LOGGER.error("register_remote requires device_id parameter")
+            return
+        if _unknown_devices(hass, [device_id]):
+            _LOGGER.error("register_remote: unknown device %s", device_id)
+            return
+        
+        queue_policy = call.data.get("queue_policy", DEFAULT_QUEUE_POLICY)
+        if queue_policy not in QUEUE_POLICIES:
+            _LOGGER.error(
+                "register_remote queue_policy must be one of %s, got %s",
+                ", ".join(QUEUE_POLICIES),
+                queue_policy,
+            )
+            return
+        
+        await hass.data[DOMAIN]["store"].async_load_remote(device_id)
+        hass.data[DOMAIN]["controller"].async_register(
+            RemoteConfig(
+                device_id=device_id,
+                excluded_areas=_as_list(call.data.get("excluded_areas")),
+                power_left_entity=call.data.get("power_left_entity") or None,
+                timeout_minutes=int(call.data.get("timeout_minutes", 5)),
+                coalesce_ms=int(
+                    call.data.get("coalesce_ms", DEFAULT_COALESCE_MS)
+                ),
+                queue_size=int(call.data.get("queue_size", DEFAULT_QUEUE_SIZE)),
+                queue_policy=queue_policy,
+            )
+        )
+    
+    async def handle_unregister_remote(call: ServiceCall) -> None:
+        """Handle unregister_remote service call."""
+        device_id = call.data.get("device_id")
+        
+        if not device_id:
+            _LOGGER.error("unregister_remote requires device_id parameter")
+            return
+        
+        hass.data[DOMAIN]["controller"].async_unregister(device_id)
+    
+    async def handle_register_group_remote(call: ServiceCall) -> None:
+        """Handle register_group_remote service call."""
+        device_id = call.data.get("device_id")
+        
+        if not device_id:
+            _LOGGER.error("register_group_remote requires device_id parameter")
+            return
+        
+        if call.data.get("light_group_2") or call.data.get("light_group_3"):
+            _LOGGER.warning(
+                "register_group_remote only handles light group 1 natively; the "
+                "remote's buttons for groups 2 and 3 cannot be told apart yet"
+            )
+        
+        hass.data[DOMAIN]["group_remotes"].async_register(
+            GroupRemoteConfig(
+                device_id=device_id,
+                lights=_target_entities(call.data.get("light_group_1")),
+                brightness_step=int(
+                    call.data.get("brightness_step", DEFAULT_BRIGHTNESS_STEP)
+                ),
+            )
+        )
+    
+    async def handle_unregister_group_remote(call: ServiceCall) -> None:
+        """Handle unregister_group_remote service call."""
+        device_id = call.data.get("device_id")
+        
+        if not device_id:
+            _LOGGER.error("unregister_group_remote requires device_id parameter")
+            return
+        
+        hass.data[DOMAIN]["group_remotes"].async_unregister(device_id)
+    
+    async def handle_bind_banks(call: ServiceCall) -> dict[str, Any]:
+        """Handle bind_banks service call."""
+        group_caster = hass.data[DOMAIN]["group_caster"]
+        skipped: dict[str, list[str]] = {}
+        
+        for bank in BANK_GROUP_IDS:
+            field = f"bank_{bank}"
+            if field not in call.data:
+                continue
+            entity_ids = _target_entities(call.data[field])
+            try:
+                skipped[field] = await async_bind_bank(group_caster, bank, entity_ids)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.error("Could not bind bank %d: %s", bank, err)
+        
+        return {"skipped": skipped}
+    
+    async def handle_unbind_banks(call: ServiceCall) -> None:
+        """Handle unbind_banks service call."""
+        for bank in call.data["banks"] or BANK_GROUP_IDS:
+            try:
+                await async_unbind_bank(hass, bank)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.error("Could not unbind bank %d: %s", bank, err)
+    
+    async def handle_blink(call: ServiceCall) -> None:
+        """Handle blink service call."""
+        entity_ids = _target_entities(call.data.get("entity_id"))
+        
+        if not entity_ids:
+            _LOGGER.error("blink requires entity_id parameter")
+            return
+        
+        # Blinks with the same key (by default the remote) replace each other
+        hass.data[DOMAIN]["feedback"].async_blink(
+            call.data.get("device_id") or tuple(sorted(entity_ids)),
+            entity_ids,
+            int(call.data.get("count", 2)),
+        )
+    
+    async def handle_get_area_lights(call: ServiceCall) -> dict[str, Any]:
+        """Handle get_area_lights service call."""
+        area_ids = _as_list(call.data.get("area_id"))
+        index = hass.data[DOMAIN]["area_index"]
+        
+        if not area_ids:
+            return {"areas": index.as_dict()}
+        return {"areas": {area_id: index.lights(area_id) for area_id in area_ids}}
+    
+    async def handle_frame_trace(call: ServiceCall) -> dict[str, Any]:
+        """Handle frame_trace service call (3-bank quirk frame recording)."""
+        quirk = sys.modules.get(BANK_QUIRK_MODULE)
+        
+        if quirk is None:
+            _LOGGER.error(
+                "frame_trace requires the 3-bank quirk (%s.py) to be installed",
+                BANK_QUIRK_MODULE,
+            )
+            return {"frames": []}
+        
+        # Hand out what was recorded so far, then (re)start or stop recording
+        frames = quirk.dump_frame_trace()
+        if call.data.get("enabled", True):
+            quirk.enable_frame_trace(
+                int(call.data.get("size", DEFAULT_FRAME_TRACE_SIZE))
+            )
+        else:
+            quirk.disable_frame_trace()
+        return {"frames": frames}
+    
+    async def handle_get_metrics(call: ServiceCall) -> dict[str, Any]:
+        """Handle get_metrics service call."""
+        return {
+            "storage": hass.data[DOMAIN]["store"].metrics,
+            "group_cast": hass.data[DOMAIN]["group_caster"].metrics,
+            "feedback": hass.data[DOMAIN]["feedback"].metrics,
+            "capabilities": hass.data[DOMAIN]["capabilities"].metrics,
+            "commands": hass.data[DOMAIN]["commands"].metrics,
+            "presses": hass.data[DOMAIN]["press_metrics"].as_dict(),
+            "queues": hass.data[DOMAIN]["controller"].queue_metrics,
+        }
     
     hass.services.async_register(DOMAIN, SERVICE_SET_STATE, handle_set_state)
     hass.services.async_register(
@@ -138,24 +477,105 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         handle_get_state,
         supports_response=SupportsResponse.ONLY
     )
+    hass.services.async_register(DOMAIN, SERVICE_UPDATE_STATE, handle_update_state)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_STATES,
+        handle_get_states,
+        supports_response=SupportsResponse.ONLY
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_REGISTER_REMOTE, handle_register_remote
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_UNREGISTER_REMOTE, handle_unregister_remote
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_REGISTER_GROUP_REMOTE, handle_register_group_remote
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_UNREGISTER_GROUP_REMOTE, handle_unregister_group_remote
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BIND_BANKS,
+        handle_bind_banks,
+        supports_response=SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_UNBIND_BANKS,
+        handle_unbind_banks,
+        schema=UNBIND_BANKS_SCHEMA
+    )
+    hass.services.async_register(DOMAIN, SERVICE_BLINK, handle_blink)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_AREA_LIGHTS,
+        handle_get_area_lights,
+        supports_response=SupportsResponse.ONLY
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_METRICS,
+        handle_get_metrics,
+        supports_response=SupportsResponse.ONLY
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FRAME_TRACE,
+        handle_frame_trace,
+        supports_response=SupportsResponse.OPTIONAL
+    )
+    
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
-    _LOGGER.info("Registered services: %s.set_state, %s.get_state", DOMAIN, DOMAIN)
+    hass.data[DOMAIN]["setup_ms"] = (time.perf_counter() - setup_start) * 1000
+    _LOGGER.debug(
+        "Eglo Remote ZHA set up in %.1f ms, quirks: %s",
+        hass.data[DOMAIN]["setup_ms"],
+        ", ".join(IMPORT_MS) or "none",
+    )
+    
+    # Let remote blueprints (re-)register after an integration reload
+    hass.bus.async_fire(EVENT_READY)
     
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
     
     # Unregister services
     hass.services.async_remove(DOMAIN, SERVICE_SET_STATE)
     hass.services.async_remove(DOMAIN, SERVICE_GET_STATE)
+    hass.services.async_remove(DOMAIN, SERVICE_UPDATE_STATE)
+    hass.services.async_remove(DOMAIN, SERVICE_GET_STATES)
+    hass.services.async_remove(DOMAIN, SERVICE_REGISTER_REMOTE)
+    hass.services.async_remove(DOMAIN, SERVICE_UNREGISTER_REMOTE)
+    hass.services.async_remove(DOMAIN, SERVICE_REGISTER_GROUP_REMOTE)
+    hass.services.async_remove(DOMAIN, SERVICE_UNREGISTER_GROUP_REMOTE)
+    hass.services.async_remove(DOMAIN, SERVICE_BIND_BANKS)
+    hass.services.async_remove(DOMAIN, SERVICE_UNBIND_BANKS)
+    hass.services.async_remove(DOMAIN, SERVICE_BLINK)
+    hass.services.async_remove(DOMAIN, SERVICE_GET_AREA_LIGHTS)
+    hass.services.async_remove(DOMAIN, SERVICE_GET_METRICS)
+    hass.services.async_remove(DOMAIN, SERVICE_FRAME_TRACE)
     
-    # Clean up hass.data
+    # Clean up hass.data, writing out any pending state first
     if DOMAIN in hass.data:
+        hass.data[DOMAIN]["controller"].async_stop()
+        hass.data[DOMAIN]["group_remotes"].async_stop()
+        hass.data[DOMAIN]["feedback"].async_shutdown()
+        hass.data[DOMAIN]["commands"].async_shutdown()
+        hass.data[DOMAIN]["group_caster"].async_stop()
+        hass.data[DOMAIN]["dispatcher"].async_stop()
+        hass.data[DOMAIN]["area_index"].async_stop()
+        hass.data[DOMAIN]["capabilities"].async_stop()
+        await hass.data[DOMAIN]["store"].async_shutdown()
         hass.data.pop(DOMAIN)
     
-    _LOGGER.info("Eglo Remote ZHA integration disabled")
+    _LOGGER.debug("Eglo Remote ZHA integration unloaded")
     return True
-
-
@@ -0,0 +1,167 @@
+"""In-memory index of the light entities in each area.
+
+Built once from the entity, device and area registries and kept current
+from their update events, so resolving "the lights in this area" or cycling
+through areas never has to walk the registries on a button press.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+LIGHT_DOMAIN = "light"
+
+
+class AreaLightIndex:
+    """Area -> ordered light entity list, updated incrementally."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        # area_id -> sorted light entity_ids
+        self._area_lights: dict[str, list[str]] = {}
+        # light entity_id -> area_id it is indexed under
+        self._entity_area: dict[str, str] = {}
+        # area_ids in registry order
+        self._areas: list[str] = []
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Build the index and follow registry updates."""
+        self._async_rebuild()
+        bus = self._hass.bus
+        self._unsubs = [
+            bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_updated
+            ),
+            bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_updated
+            ),
+            bus.async_listen(ar.EVENT_AREA_REGISTRY_UPDATED, self._async_area_updated),
+        ]
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following registry updates."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    @callback
+    def lights(self, area_id: str | None) -> list[str]:
+        """Return the light entity_ids in an area."""
+        if not area_id:
+            return []
+        return list(self._area_lights.get(area_id, ()))
+
+    @callback
+    def area_of(self, entity_id: str) -> str | None:
+        """Return the area a light is indexed under."""
+        return self._entity_area.get(entity_id)
+
+    @callback
+    def areas(self) -> list[str]:
+        """Return all area_ids in registry order."""
+        return list(self._areas)
+
+    @callback
+    def as_dict(self) -> dict[str, list[str]]:
+        """Return a copy of the whole index."""
+        return {area_id: list(lights) for area_id, lights in self._area_lights.items()}
+
+    @callback
+    def _async_rebuild(self) -> None:
+        """Build the index from scratch."""
+        self._area_lights.clear()
+        self._entity_area.clear()
+        self._areas = [area.id for area in ar.async_get(self._hass).async_list_areas()]
+        for entry in er.async_get(self._hass).entities.values():
+            if entry.domain == LIGHT_DOMAIN:
+                self._async_index_entity(entry.entity_id)
+        _LOGGER.debug(
+            "Indexed %d light(s) in %d area(s)",
+            len(self._entity_area),
+            len(self._area_lights),
+        )
+
+    @callback
+    def _async_resolve_area(self, entity_id: str) -> str | None:
+        """Return the effective area of a light (own area, else its device's)."""
+        entry = er.async_get(self._hass).async_get(entity_id)
+        if entry is None or entry.disabled_by is not None:
+            return None
+        if entry.area_id:
+            return entry.area_id
+        if entry.device_id:
+            device = dr.async_get(self._hass).async_get(entry.device_id)
+            if device is not None:
+                return device.area_id
+        return None
+
+    @callback
+    def _async_index_entity(self, entity_id: str) -> None:
+        """(Re-)index a single light entity."""
+        self._async_unindex_entity(entity_id)
+        area_id = self._async_resolve_area(entity_id)
+        if area_id is None:
+            return
+        lights = self._area_lights.setdefault(area_id, [])
+        lights.append(entity_id)
+        lights.sort()
+        self._entity_area[entity_id] = area_id
+
+    @callback
+    def _async_unindex_entity(self, entity_id: str) -> None:
+        """Remove a light entity from the index."""
+        area_id = self._entity_area.pop(entity_id, None)
+        if area_id is None:
+            return
+        lights = self._area_lights[area_id]
+        lights.remove(entity_id)
+        if not lights:
+            del self._area_lights[area_id]
+
+    @callback
+    def _async_entity_updated(self, event: Event) -> None:
+        """Follow entity registry changes."""
+        data = event.data
+        entity_id: str = data["entity_id"]
+        if old_entity_id := data.get("old_entity_id"):
+            self._async_unindex_entity(old_entity_id)
+        if not entity_id.startswith(f"{LIGHT_DOMAIN}."):
+            return
+        if data["action"] == "remove":
+            self._async_unindex_entity(entity_id)
+        else:
+            self._async_index_entity(entity_id)
+
+    @callback
+    def _async_device_updated(self, event: Event) -> None:
+        """Re-index the lights of a device whose area changed."""
+        data = event.data
+        if data["action"] == "update" and "area_id" not in data.get("changes", {}):
+            return
+        ent_reg = er.async_get(self._hass)
+        for entry in er.async_entries_for_device(
+            ent_reg, data["device_id"], include_disabled_entities=True
+        ):
+            if entry.domain == LIGHT_DOMAIN:
+                self._async_index_entity(entry.entity_id)
+
+    @callback
+    def _async_area_updated(self, event: Event) -> None:
+        """Follow area creation, removal and reordering."""
+        self._areas = [area.id for area in ar.async_get(self._hass).async_list_areas()]
+        if event.data["action"] == "remove":
+            area_id = event.data["area_id"]
+            for entity_id in self._area_lights.pop(area_id, []):
+                self._entity_area.pop(entity_id, None)
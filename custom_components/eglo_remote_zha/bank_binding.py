@@ -0,0 +1,62 @@
+"""Direct Touchlink bank binding for the AwoX remote.
+
+The AwoX ERCU_3groups_Zm sends every press as a group-cast to the Touchlink
+group of its active bank (0x800A/0x800B/0x800C). Making lights members of
+those groups lets them react to the remote directly, without a round trip
+through Home Assistant (and while it is restarting). The coordinator still
+receives the same frames, so events, state sync and automations keep working.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import HomeAssistant
+
+from .const import BANK_GROUP_IDS
+from .group_cast import GroupCaster
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_bind_bank(
+    group_caster: GroupCaster,
+    bank: int,
+    entity_ids: list[str],
+) -> list[str]:
+    """Make exactly these lights members of a bank's group.
+
+    Returns the lights that could not be bound because they are not ZHA lights.
+    """
+    members = group_caster.zha_members(entity_ids)
+    skipped = [entity_id for entity_id in entity_ids if entity_id not in members]
+    if skipped:
+        _LOGGER.warning(
+            "Bank %d: %s are not ZHA lights and will not follow the remote directly",
+            bank,
+            ", ".join(skipped),
+        )
+
+    await group_caster.async_sync_group(
+        f"Eglo Remote bank {bank}",
+        set(members.values()),
+        group_id=BANK_GROUP_IDS[bank],
+    )
+    _LOGGER.info(
+        "Bound %d light(s) to bank %d (group 0x%04X)",
+        len(members),
+        bank,
+        BANK_GROUP_IDS[bank],
+    )
+    return skipped
+
+
+async def async_unbind_bank(hass: HomeAssistant, bank: int) -> None:
+    """Remove a bank's group, so its lights only follow Home Assistant again."""
+    from homeassistant.components.zha.helpers import get_zha_gateway
+
+    gateway = get_zha_gateway(hass)
+    group_id = BANK_GROUP_IDS[bank]
+    if group_id in gateway.groups:
+        await gateway.async_remove_zigpy_group(group_id)
+        _LOGGER.info("Unbound bank %d (group 0x%04X)", bank, group_id)
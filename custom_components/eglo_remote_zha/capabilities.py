@@ -0,0 +1,269 @@
+"""In-memory index of light capabilities and a per-capability command planner.
+
+The supported colour modes, colour temperature range and transition support
+of every light are read from its state once and kept current from state
+changes, together with a snapshot of its brightness, colour temperature and
+colour, so relative steps can be computed per light without looking up (or
+rendering templates over) the state machine on a press.
+
+The planner splits a light command for a set of lights into one well-formed
+call per capability bucket: colours only go to lights that can show them,
+colour temperatures are clamped to each light's range (or left out for
+lights without colour), and transitions are only sent to lights that
+support them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_COLOR_TEMP_KELVIN,
+    ATTR_HS_COLOR,
+    ATTR_MAX_COLOR_TEMP_KELVIN,
+    ATTR_MIN_COLOR_TEMP_KELVIN,
+    ATTR_SUPPORTED_COLOR_MODES,
+    ATTR_TRANSITION,
+    LightEntityFeature,
+    color_supported,
+    color_temp_supported,
+)
+from homeassistant.const import (
+    ATTR_SUPPORTED_FEATURES,
+    EVENT_STATE_CHANGED,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.util import color as color_util
+
+_LOGGER = logging.getLogger(__name__)
+
+LIGHT_DOMAIN = "light"
+
+
+@dataclass(frozen=True, slots=True)
+class LightCapabilities:
+    """What a single light can do."""
+
+    color: bool
+    color_temp: bool
+    min_mireds: int | None
+    max_mireds: int | None
+    transition: bool
+
+    @classmethod
+    def from_state(cls, state: State) -> LightCapabilities:
+        """Read the capabilities from a light's state attributes."""
+        attributes = state.attributes
+        modes = attributes.get(ATTR_SUPPORTED_COLOR_MODES)
+        # The warmest colour temperature has the most mireds
+        min_kelvin = attributes.get(ATTR_MIN_COLOR_TEMP_KELVIN)
+        max_kelvin = attributes.get(ATTR_MAX_COLOR_TEMP_KELVIN)
+        return cls(
+            color=color_supported(modes),
+            color_temp=color_temp_supported(modes),
+            min_mireds=(
+                color_util.color_temperature_kelvin_to_mired(max_kelvin)
+                if max_kelvin
+                else None
+            ),
+            max_mireds=(
+                color_util.color_temperature_kelvin_to_mired(min_kelvin)
+                if min_kelvin
+                else None
+            ),
+            transition=bool(
+                attributes.get(ATTR_SUPPORTED_FEATURES, 0)
+                & LightEntityFeature.TRANSITION
+            ),
+        )
+
+    def adapt(self, data: dict[str, Any]) -> dict[str, Any] | None:
+        """Return the service data this light can take, None to leave it out."""
+        if ATTR_HS_COLOR in data and not self.color:
+            return None
+        if ATTR_COLOR_TEMP_KELVIN in data:
+            if self.color_temp:
+                data = {
+                    **data,
+                    ATTR_COLOR_TEMP_KELVIN: self._clamp_kelvin(
+                        data[ATTR_COLOR_TEMP_KELVIN]
+                    ),
+                }
+            elif not self.color:
+                return None
+        if ATTR_TRANSITION in data and not self.transition:
+            data = {key: value for key, value in data.items() if key != ATTR_TRANSITION}
+        return data
+
+    def clamp_mireds(self, mireds: int) -> int:
+        """Clamp a colour temperature in mireds to the light's range."""
+        if self.min_mireds is not None and mireds < self.min_mireds:
+            return self.min_mireds
+        if self.max_mireds is not None and mireds > self.max_mireds:
+            return self.max_mireds
+        return mireds
+
+    def _clamp_kelvin(self, kelvin: int) -> int:
+        """Clamp a colour temperature in kelvin to the light's range."""
+        mireds = color_util.color_temperature_kelvin_to_mired(kelvin)
+        if (clamped := self.clamp_mireds(mireds)) == mireds:
+            return kelvin
+        return color_util.color_temperature_mired_to_kelvin(clamped)
+
+
+@dataclass(slots=True)
+class LightSnapshot:
+    """Last known brightness and colour of a single light."""
+
+    on: bool
+    brightness: int | None
+    mireds: int | None
+    hs_color: tuple[float, float] | None
+
+    @classmethod
+    def from_state(
+        cls, state: State, previous: LightSnapshot | None = None
+    ) -> LightSnapshot:
+        """Read the snapshot from a light's state attributes.
+
+        Lights that are off report no brightness or colour; the values they
+        had before are kept.
+        """
+        attributes = state.attributes
+        on = state.state == STATE_ON
+        if not on and previous is not None:
+            return cls(False, previous.brightness, previous.mireds, previous.hs_color)
+        kelvin = attributes.get(ATTR_COLOR_TEMP_KELVIN)
+        hs_color = attributes.get(ATTR_HS_COLOR)
+        return cls(
+            on=on,
+            brightness=attributes.get(ATTR_BRIGHTNESS),
+            mireds=(
+                color_util.color_temperature_kelvin_to_mired(kelvin)
+                if kelvin
+                else None
+            ),
+            hs_color=tuple(hs_color) if hs_color else None,
+        )
+
+
+class LightCapabilityIndex:
+    """Light entity_id -> capabilities and snapshot, kept current from state."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._capabilities: dict[str, LightCapabilities] = {}
+        self._snapshots: dict[str, LightSnapshot] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+        self._planned_calls = 0
+        self._split_commands = 0
+        self._skipped_lights = 0
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """Return planner counters."""
+        return {
+            "lights": len(self._capabilities),
+            "planned_calls": self._planned_calls,
+            "split_commands": self._split_commands,
+            "skipped_lights": self._skipped_lights,
+        }
+
+    @callback
+    def async_start(self) -> None:
+        """Build the index and follow state changes."""
+        for state in self._hass.states.async_all(LIGHT_DOMAIN):
+            self._async_index(state.entity_id, state)
+        self._unsub = self._hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._event_filter,
+        )
+        _LOGGER.debug("Indexed capabilities of %d light(s)", len(self._capabilities))
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following state changes."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def get(self, entity_id: str) -> LightCapabilities | None:
+        """Return the capabilities of a light, if known."""
+        return self._capabilities.get(entity_id)
+
+    @callback
+    def snapshot(self, entity_id: str) -> LightSnapshot | None:
+        """Return the last known brightness and colour of a light."""
+        return self._snapshots.get(entity_id)
+
+    @callback
+    def async_assume(self, entity_ids: list[str], mireds: int) -> None:
+        """Record a colour temperature just sent, ahead of the state change.
+
+        Relative steps from presses that arrive before the lights report
+        their new state then build on the level that was sent.
+        """
+        for entity_id in entity_ids:
+            if (snapshot := self._snapshots.get(entity_id)) is None:
+                continue
+            capabilities = self._capabilities.get(entity_id)
+            snapshot.mireds = (
+                capabilities.clamp_mireds(mireds) if capabilities else mireds
+            )
+
+    @callback
+    def plan(
+        self, entity_ids: list[str], data: dict[str, Any]
+    ) -> list[tuple[list[str], dict[str, Any]]]:
+        """Split a light command into (entity_ids, service data) buckets.
+
+        Lights whose capabilities are not known yet get the command as it is.
+        """
+        buckets: dict[tuple, tuple[list[str], dict[str, Any]]] = {}
+        for entity_id in entity_ids:
+            capabilities = self._capabilities.get(entity_id)
+            params = data if capabilities is None else capabilities.adapt(data)
+            if params is None:
+                self._skipped_lights += 1
+                continue
+            key = tuple(sorted(params.items()))
+            if (bucket := buckets.get(key)) is None:
+                bucket = buckets[key] = ([], params)
+            bucket[0].append(entity_id)
+
+        self._planned_calls += len(buckets)
+        if len(buckets) > 1:
+            self._split_commands += 1
+        return list(buckets.values())
+
+    @callback
+    def _async_index(self, entity_id: str, state: State | None) -> None:
+        """(Re-)index a single light from its state."""
+        if state is None:
+            self._capabilities.pop(entity_id, None)
+            self._snapshots.pop(entity_id, None)
+        elif state.state != STATE_UNAVAILABLE:
+            # Unavailable lights report no attributes; keep the known ones
+            self._capabilities[entity_id] = LightCapabilities.from_state(state)
+            self._snapshots[entity_id] = LightSnapshot.from_state(
+                state, self._snapshots.get(entity_id)
+            )
+
+    @callback
+    def _event_filter(self, event_data: Mapping[str, Any]) -> bool:
+        """Let only state changes of lights through."""
+        return event_data["entity_id"].startswith(f"{LIGHT_DOMAIN}.")
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Follow the state changes of lights."""
+        self._async_index(event.data["entity_id"], event.data["new_state"])
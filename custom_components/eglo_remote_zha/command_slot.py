@@ -0,0 +1,214 @@
+"""Latest-wins command slots for light targets.
+
+Every light target (a light, a ZHA group entity or a set of lights addressed
+in one call) has a slot holding at most one call in flight plus the commands
+waiting behind it. A press hands its light commands to the slots and moves
+on; a ``turn_on`` that arrives while an earlier ``turn_on`` for the same
+target is still waiting replaces it, so the mesh only carries the state that
+is wanted by the time the target is free again. Relative brightness steps
+are added up rather than replaced, and commands that cannot be merged (such
+as ``toggle``) are kept in order.
+
+One light can be part of several targets (its capability bucket, a colour
+temperature group or an area's ZHA group differ from press to press), so
+commands are also ordered per light: a command is only sent once every
+earlier command reaching one of its lights is out, and it only absorbs a
+newer command while no command for another target has been queued behind it
+for one of those lights. The latest command for a light always lands last.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_BRIGHTNESS_PCT,
+    ATTR_BRIGHTNESS_STEP_PCT,
+    ATTR_COLOR_TEMP_KELVIN,
+    ATTR_HS_COLOR,
+)
+from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_ON
+from homeassistant.core import HomeAssistant, callback
+
+from .metrics import PressMetrics, PressTrace, current_trace
+
+_LOGGER = logging.getLogger(__name__)
+
+LIGHT_DOMAIN = "light"
+
+_ABSOLUTE_BRIGHTNESS = {ATTR_BRIGHTNESS, ATTR_BRIGHTNESS_PCT}
+_COLOR = {ATTR_COLOR_TEMP_KELVIN, ATTR_HS_COLOR}
+
+
+@dataclass
+class _Command:
+    """A light service call waiting for its target."""
+
+    service: str
+    data: dict[str, Any]
+    trace: PressTrace | None
+    # lights the call reaches (the members of a group entity)
+    lights: tuple[str, ...]
+    # resolved once the call is out
+    done: asyncio.Future
+    # earlier commands reaching the same lights
+    after: list[asyncio.Future]
+
+
+@dataclass
+class _Slot:
+    """Commands of one target: the one in flight and those waiting."""
+
+    waiting: deque[_Command] = field(default_factory=deque)
+    task: asyncio.Task | None = None
+
+
+def _merge(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the turn_on data that has the effect of old followed by new.
+
+    Returns None if the two cannot be combined into one call.
+    """
+    if ATTR_BRIGHTNESS_STEP_PCT in new and old.keys() & _ABSOLUTE_BRIGHTNESS:
+        return None
+    data = dict(old)
+    if new.keys() & _ABSOLUTE_BRIGHTNESS:
+        for key in (*_ABSOLUTE_BRIGHTNESS, ATTR_BRIGHTNESS_STEP_PCT):
+            data.pop(key, None)
+    if new.keys() & _COLOR:
+        for key in _COLOR:
+            data.pop(key, None)
+    data.update(new)
+    if ATTR_BRIGHTNESS_STEP_PCT in old and ATTR_BRIGHTNESS_STEP_PCT in new:
+        step = old[ATTR_BRIGHTNESS_STEP_PCT] + new[ATTR_BRIGHTNESS_STEP_PCT]
+        data[ATTR_BRIGHTNESS_STEP_PCT] = max(-100, min(100, step))
+    return data
+
+
+class LightCommandSlots:
+    """Send light commands per target, superseding those not sent yet."""
+
+    def __init__(self, hass: HomeAssistant, metrics: PressMetrics) -> None:
+        """Initialize the slots."""
+        self._hass = hass
+        self._metrics = metrics
+        # target entity_ids -> slot, while the target has commands
+        self._slots: dict[tuple[str, ...], _Slot] = {}
+        # light entity_id -> done future of the latest command reaching it
+        self._tails: dict[str, asyncio.Future] = {}
+        self._sent = 0
+        self._superseded = 0
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """Return command counters."""
+        return {
+            "sent": self._sent,
+            "superseded": self._superseded,
+            "busy_targets": len(self._slots),
+            "waiting": sum(len(slot.waiting) for slot in self._slots.values()),
+        }
+
+    @callback
+    def async_send(
+        self,
+        service: str,
+        entity_ids: list[str],
+        data: dict[str, Any],
+        lights: list[str] | None = None,
+    ) -> None:
+        """Send a light command to a target once earlier commands are out.
+
+        lights are the lights the target reaches, if it is a group entity.
+        """
+        key = tuple(entity_ids)
+        lights_key = tuple(lights) if lights is not None else key
+        if (slot := self._slots.get(key)) is None:
+            slot = self._slots[key] = _Slot()
+        trace = current_trace.get()
+
+        if slot.waiting and service == SERVICE_TURN_ON:
+            last = slot.waiting[-1]
+            if (
+                last.service == SERVICE_TURN_ON
+                and last.lights == lights_key
+                and all(self._tails.get(light) is last.done for light in lights_key)
+                and (merged := _merge(last.data, data)) is not None
+            ):
+                last.data = merged
+                last.trace = trace
+                self._superseded += 1
+                return
+
+        done = self._hass.loop.create_future()
+        after = {
+            id(tail): tail
+            for light in lights_key
+            if (tail := self._tails.get(light)) is not None and not tail.done()
+        }
+        for light in lights_key:
+            self._tails[light] = done
+        slot.waiting.append(
+            _Command(service, data, trace, lights_key, done, list(after.values()))
+        )
+
+        if slot.task is None:
+            slot.task = self._hass.async_create_background_task(
+                self._async_drain(key, slot), f"eglo_remote_zha light {key[0]}"
+            )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop the commands that were not sent yet."""
+        for slot in self._slots.values():
+            slot.waiting.clear()
+            if slot.task is not None:
+                slot.task.cancel()
+        self._slots.clear()
+        self._tails.clear()
+
+    async def _async_drain(self, key: tuple[str, ...], slot: _Slot) -> None:
+        """Send the commands of a target one at a time."""
+        try:
+            while slot.waiting:
+                command = slot.waiting[0]
+                if command.after:
+                    # Commands for other targets reaching these lights go first
+                    await asyncio.wait(command.after)
+                slot.waiting.popleft()
+                try:
+                    await self._hass.services.async_call(
+                        LIGHT_DOMAIN,
+                        command.service,
+                        {ATTR_ENTITY_ID: list(key), **command.data},
+                        blocking=True,
+                    )
+                except Exception:  # noqa: BLE001
+                    _LOGGER.warning(
+                        "Light command %s for %s failed",
+                        command.service,
+                        ", ".join(key),
+                        exc_info=True,
+                    )
+                    continue
+                else:
+                    self._sent += 1
+                    self._metrics.mark("complete", command.trace)
+                finally:
+                    self._async_done(command)
+        finally:
+            slot.task = None
+            if self._slots.get(key) is slot:
+                del self._slots[key]
+
+    @callback
+    def _async_done(self, command: _Command) -> None:
+        """Let the commands queued behind a sent command go."""
+        command.done.set_result(None)
+        for light in command.lights:
+            if self._tails.get(light) is command.done:
+                del self._tails[light]
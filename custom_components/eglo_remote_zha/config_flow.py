@@ -7,9 +7,9 @@ from typing import Any
 from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
 
-_LOGGER = logging.getLogger(__name__)
+from .const import DOMAIN
 
-DOMAIN = "eglo_remote_zha"
+_LOGGER = logging.getLogger(__name__)
 
 
 class EgloRemoteZHAConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
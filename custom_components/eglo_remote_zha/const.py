@@ -0,0 +1,69 @@
+"""Constants for the Eglo Remote ZHA integration."""
+
+DOMAIN = "eglo_remote_zha"
+
+# Persistent state storage, one compact typed record per remote
+# ("<key>.<device_id>"); version 2 files held untyped values
+STORAGE_VERSION = 3
+STORAGE_KEY = "eglo_remote_zha_state"
+
+# Single-file layout (all remotes in "<key>"), migrated on first start
+LEGACY_STORAGE_VERSION = 1
+
+# ZHA groups created for group-casting to areas (name -> group_id), so only
+# those are ever refreshed or removed
+GROUP_STORAGE_VERSION = 1
+GROUP_STORAGE_KEY = "eglo_remote_zha_groups"
+
+# Seconds to coalesce state mutations in memory before writing them to disk
+SAVE_DELAY = 10
+
+# Selection value meaning "every light in the area"
+ALL_LIGHTS = "all"
+
+# State tiers: kept in memory only, saved debounced, or saved right away
+TIER_VOLATILE = "volatile"
+TIER_DURABLE = "durable"
+TIER_IMMEDIATE = "immediate"
+TIERS = (TIER_VOLATILE, TIER_DURABLE, TIER_IMMEDIATE)
+
+# Tier of keys that were not declared otherwise (others are TIER_DURABLE)
+DEFAULT_KEY_TIERS = {"last_activity": TIER_VOLATILE}
+
+# What a full per-remote action queue does with a new press: drop the oldest
+# queued press, drop the new one, or merge it into a queued press of the same
+# action (dropping the oldest if there is none)
+QUEUE_DROP_OLDEST = "drop_oldest"
+QUEUE_DROP_NEWEST = "drop_newest"
+QUEUE_COALESCE = "coalesce"
+QUEUE_POLICIES = (QUEUE_DROP_OLDEST, QUEUE_DROP_NEWEST, QUEUE_COALESCE)
+
+# Service names
+SERVICE_SET_STATE = "set_state"
+SERVICE_GET_STATE = "get_state"
+SERVICE_GET_METRICS = "get_metrics"
+SERVICE_UPDATE_STATE = "update_state"
+SERVICE_GET_STATES = "get_states"
+SERVICE_GET_AREA_LIGHTS = "get_area_lights"
+SERVICE_REGISTER_REMOTE = "register_remote"
+SERVICE_UNREGISTER_REMOTE = "unregister_remote"
+SERVICE_REGISTER_GROUP_REMOTE = "register_group_remote"
+SERVICE_UNREGISTER_GROUP_REMOTE = "unregister_group_remote"
+SERVICE_BIND_BANKS = "bind_banks"
+SERVICE_UNBIND_BANKS = "unbind_banks"
+SERVICE_BLINK = "blink"
+SERVICE_FRAME_TRACE = "frame_trace"
+
+# Module name of the 3-bank quirk, a ZHA custom quirk loaded from its own
+# file under its file name
+BANK_QUIRK_MODULE = "eglo_ercu_awox_3banks"
+DEFAULT_FRAME_TRACE_SIZE = 64
+
+# Fired once the native controller is listening, so blueprints can (re-)register
+EVENT_READY = f"{DOMAIN}_ready"
+
+# Re-emitted for every resolved AwoX remote press
+EVENT_ACTION = f"{DOMAIN}_action"
+
+# Touchlink groups the AwoX remote group-casts to, per bank
+BANK_GROUP_IDS = {1: 0x800A, 2: 0x800B, 3: 0x800C}
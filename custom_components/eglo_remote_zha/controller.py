@@ -0,0 +1,660 @@
+"""Native area/light selection controller for the AwoX ERCU_3groups_Zm remote.
+
+This is the Python counterpart of the area-selection blueprint: it receives
+resolved actions for registered remotes from the ActionDispatcher, keeps the
+per-remote selection in the state store and calls light services directly, so
+a press does not have to go through template rendering and script step
+scheduling.
+
+Repeated short presses of the dim and colour temperature buttons are
+coalesced per remote: the first press of a burst is handled right away, and
+the presses that follow within the coalescing window are sent as a single
+cumulative step when the window closes.
+
+Every remote has its own bounded action queue, worked off by its own task,
+so a slow action on one remote never delays another. When the queue is full
+the remote's queue policy decides which press is dropped or merged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import partial
+import logging
+from typing import Any
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import color as color_util, dt as dt_util
+
+from .area_index import AreaLightIndex
+from .capabilities import LightCapabilityIndex
+from .command_slot import LightCommandSlots
+from .const import ALL_LIGHTS, QUEUE_COALESCE, QUEUE_DROP_NEWEST
+from .dispatch import ActionDispatcher
+from .feedback import BlinkScheduler
+from .group_cast import GroupCaster
+from .metrics import PressMetrics, PressTrace, current_trace
+from .storage import RemoteStateStore
+
+_LOGGER = logging.getLogger(__name__)
+
+# Selection state keys (shared with the set_state/get_state services)
+KEY_CURRENT_AREA = "current_area"
+KEY_CURRENT_LIGHT = "current_light"
+KEY_LAST_ACTIVITY = "last_activity"
+
+DIM_STEP_PCT = 5
+DEFAULT_COALESCE_MS = 300
+DEFAULT_QUEUE_SIZE = 10
+DEFAULT_QUEUE_POLICY = QUEUE_COALESCE
+# Step actions whose repeated presses are combined into one cumulative step
+COALESCED_ACTIONS = {"dim_up", "dim_down", "color_temp_up", "color_temp_down"}
+# Selection actions, which only blink the lights (taking over a running blink)
+SELECTION_ACTIONS = {"refresh", "color_cycle"}
+COLOR_TEMP_STEP_MIREDS = 20
+COLOR_TEMP_CYCLE_STEP_MIREDS = 30
+DEFAULT_COLOR_TEMP_MIREDS = 250
+MIN_MIREDS = 153
+MAX_MIREDS = 454
+
+# Hue/saturation for the colour buttons
+COLOR_HS = {
+    "color_green": (85, 100),
+    "color_red": (0, 100),
+    "color_blue": (240, 100),
+}
+
+# Colour temperature range (mireds) cycled by a long press on a colour button
+COLOR_TEMP_RANGES = {
+    "color_green_long": (200, 300),
+    "color_red_long": (350, 454),
+    "color_blue_long": (153, 250),
+}
+
+
+@dataclass
+class RemoteConfig:
+    """Configuration of a remote handled by the native controller."""
+
+    device_id: str
+    excluded_areas: list[str] = field(default_factory=list)
+    power_left_entity: str | None = None
+    timeout_minutes: int = 5
+    coalesce_ms: int = DEFAULT_COALESCE_MS
+    queue_size: int = DEFAULT_QUEUE_SIZE
+    queue_policy: str = DEFAULT_QUEUE_POLICY
+
+
+@dataclass
+class _QueuedAction:
+    """A press waiting in a remote's action queue."""
+
+    action: str
+    trace: PressTrace
+    # Presses merged into this one
+    count: int = 1
+
+
+@dataclass
+class _ActionQueue:
+    """Bounded action queue of one remote and its counters."""
+
+    actions: deque[_QueuedAction] = field(default_factory=deque)
+    task: asyncio.Task | None = None
+    queued: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    max_depth: int = 0
+
+
+@dataclass
+class _Burst:
+    """Presses of one step action on one remote within the coalescing window."""
+
+    unsub: CALLBACK_TYPE
+    # Presses not handled yet, and the trace of the latest one
+    count: int = 0
+    trace: PressTrace | None = None
+
+
+class RemoteController:
+    """Handle presses of registered AwoX remotes without a template blueprint."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        store: RemoteStateStore,
+        dispatcher: ActionDispatcher,
+        area_index: AreaLightIndex,
+        group_caster: GroupCaster,
+        feedback: BlinkScheduler,
+        metrics: PressMetrics,
+        capabilities: LightCapabilityIndex,
+        commands: LightCommandSlots,
+    ) -> None:
+        """Initialize the controller."""
+        self._hass = hass
+        self._store = store
+        self._dispatcher = dispatcher
+        self._area_index = area_index
+        self._group_caster = group_caster
+        self._feedback = feedback
+        self._metrics = metrics
+        self._capabilities = capabilities
+        self._commands = commands
+        self._remotes: dict[str, RemoteConfig] = {}
+        self._queues: dict[str, _ActionQueue] = {}
+        # device_id -> cancel callback of the armed inactivity timeout
+        self._timeouts: dict[str, CALLBACK_TYPE] = {}
+        # (device_id, action) -> burst whose coalescing window is open
+        self._bursts: dict[tuple[str, str], _Burst] = {}
+        self._unsub_event: CALLBACK_TYPE | None = None
+
+    @property
+    def remotes(self) -> dict[str, RemoteConfig]:
+        """Return the registered remotes, keyed by device_id."""
+        return self._remotes
+
+    @property
+    def queue_metrics(self) -> dict[str, dict[str, int]]:
+        """Return the action queue counters of each remote."""
+        return {
+            device_id: {
+                "depth": len(queue.actions),
+                "max_depth": queue.max_depth,
+                "queued": queue.queued,
+                "dropped": queue.dropped,
+                "coalesced": queue.coalesced,
+            }
+            for device_id, queue in self._queues.items()
+        }
+
+    @callback
+    def async_start(self) -> None:
+        """Start listening for remote presses."""
+        self._unsub_event = self._dispatcher.async_subscribe(
+            self._async_handle_action_event
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening for remote presses."""
+        if self._unsub_event is not None:
+            self._unsub_event()
+            self._unsub_event = None
+        while self._timeouts:
+            _, cancel = self._timeouts.popitem()
+            cancel()
+        while self._bursts:
+            _, burst = self._bursts.popitem()
+            burst.unsub()
+        for device_id in list(self._queues):
+            self._async_drop_queue(device_id)
+
+    @callback
+    def async_register(self, config: RemoteConfig) -> None:
+        """Register (or re-configure) a remote."""
+        self._remotes[config.device_id] = config
+        self._queues.setdefault(config.device_id, _ActionQueue())
+        _LOGGER.debug("Registered remote %s: %s", config.device_id, config)
+
+        # Resume a pending timeout for the time left. last_activity is volatile
+        # by default, so after a restart a selection other than the default
+        # times out counting from now instead
+        last_activity = self._store.get(config.device_id, KEY_LAST_ACTIVITY)
+        if last_activity is not None:
+            self._async_arm_timeout(
+                config, dt_util.utc_from_timestamp(last_activity)
+            )
+        elif (
+            self._current_area(config) != self._default_area(config.device_id)
+            or self._current_light(config) != ALL_LIGHTS
+        ):
+            self._async_arm_timeout(config, dt_util.utcnow())
+        else:
+            self._async_cancel_timeout(config.device_id)
+
+    @callback
+    def async_unregister(self, device_id: str) -> None:
+        """Stop handling presses of a remote."""
+        self._remotes.pop(device_id, None)
+        self._async_cancel_timeout(device_id)
+        for key in [key for key in self._bursts if key[0] == device_id]:
+            self._bursts.pop(key).unsub()
+        self._async_drop_queue(device_id)
+
+    @callback
+    def _async_drop_queue(self, device_id: str) -> None:
+        """Drop the queued presses of a remote and stop its queue task."""
+        if (queue := self._queues.pop(device_id, None)) is None:
+            return
+        self._metrics.queued -= len(queue.actions)
+        self._metrics.dropped += len(queue.actions)
+        queue.actions.clear()
+        if queue.task is not None:
+            queue.task.cancel()
+
+    @callback
+    def _async_handle_action_event(
+        self,
+        device_id: str,
+        action: str,
+        data: dict[str, Any],
+        trace: PressTrace,
+    ) -> None:
+        """Run a resolved action if the remote is registered."""
+        if (config := self._remotes.get(device_id)) is None:
+            return
+        # A press of another button ends the bursts of the remote, so their
+        # pending steps are handled before it
+        for key in [
+            key for key in self._bursts if key[0] == device_id and key[1] != action
+        ]:
+            self._async_flush_burst(key, reopen=False)
+
+        if action in COALESCED_ACTIONS and config.coalesce_ms > 0:
+            key = (device_id, action)
+            if (burst := self._bursts.get(key)) is not None:
+                burst.count += 1
+                burst.trace = trace
+                self._metrics.coalesced += 1
+                return
+            self._async_open_burst(config, key)
+        self._async_queue_action(device_id, action, trace)
+
+    @callback
+    def _async_queue_action(
+        self, device_id: str, action: str, trace: PressTrace, count: int = 1
+    ) -> None:
+        """Queue an action behind the remote's earlier presses."""
+        config = self._remotes.get(device_id)
+        queue = self._queues.get(device_id)
+        if config is None or queue is None:
+            return
+
+        if len(queue.actions) >= max(1, config.queue_size):
+            # Only relative steps add up, and only onto the last queued press,
+            # so they never run ahead of a selection change queued before them;
+            # anything else drops the oldest press
+            if (
+                config.queue_policy == QUEUE_COALESCE
+                and action in COALESCED_ACTIONS
+                and queue.actions[-1].action == action
+            ):
+                queue.actions[-1].count += count
+                queue.coalesced += 1
+                self._metrics.coalesced += 1
+                return
+            queue.dropped += 1
+            self._metrics.dropped += 1
+            if config.queue_policy == QUEUE_DROP_NEWEST:
+                _LOGGER.debug("Queue of %s full, dropped %s", device_id, action)
+                return
+            dropped = queue.actions.popleft()
+            self._metrics.queued -= 1
+            _LOGGER.debug("Queue of %s full, dropped %s", device_id, dropped.action)
+
+        queue.actions.append(_QueuedAction(action, trace, count))
+        queue.queued += 1
+        queue.max_depth = max(queue.max_depth, len(queue.actions))
+        self._metrics.queued += 1
+        if queue.task is None:
+            queue.task = self._hass.async_create_background_task(
+                self._async_process_queue(device_id, queue),
+                f"eglo_remote_zha actions {device_id}",
+            )
+
+    async def _async_process_queue(self, device_id: str, queue: _ActionQueue) -> None:
+        """Run the queued actions of a remote, one press at a time."""
+        try:
+            while queue.actions:
+                queued = queue.actions.popleft()
+                self._metrics.queued -= 1
+                if (config := self._remotes.get(device_id)) is None:
+                    break
+                try:
+                    await self._async_run_action(config, queued)
+                except Exception:  # noqa: BLE001
+                    _LOGGER.exception(
+                        "Error handling %s of remote %s", queued.action, device_id
+                    )
+        finally:
+            queue.task = None
+
+    @callback
+    def _async_open_burst(self, config: RemoteConfig, key: tuple[str, str]) -> None:
+        """Open the coalescing window of a step action."""
+        self._bursts[key] = _Burst(
+            unsub=async_call_later(
+                self._hass,
+                config.coalesce_ms / 1000,
+                HassJob(
+                    partial(self._async_burst_window_closed, key),
+                    "eglo_remote_zha coalesce",
+                    cancel_on_shutdown=True,
+                ),
+            )
+        )
+
+    @callback
+    def _async_burst_window_closed(self, key: tuple[str, str], _now: datetime) -> None:
+        """Send the presses of a window, coalescing on while presses go on."""
+        self._async_flush_burst(key, reopen=True)
+
+    @callback
+    def _async_flush_burst(self, key: tuple[str, str], reopen: bool) -> None:
+        """Close a burst and queue its pending presses as one step."""
+        if (burst := self._bursts.pop(key, None)) is None:
+            return
+        burst.unsub()
+        if not burst.count or burst.trace is None:
+            return
+        device_id, action = key
+        if reopen and (config := self._remotes.get(device_id)) is not None:
+            self._async_open_burst(config, key)
+        self._async_queue_action(device_id, action, burst.trace, burst.count)
+
+    async def _async_run_action(
+        self, config: RemoteConfig, queued: _QueuedAction
+    ) -> None:
+        """Run a queued action of a remote."""
+        device_id = config.device_id
+        current_trace.set(queued.trace)
+        await self._store.async_load_remote(device_id)
+        now = dt_util.utcnow()
+        self._store.async_set(device_id, KEY_LAST_ACTIVITY, now.timestamp())
+        self._async_arm_timeout(config, now)
+        self._metrics.mark("state")
+        if queued.action not in SELECTION_ACTIONS:
+            # Restore the lights of a running blink first, so its restore does
+            # not undo the commands of this press
+            await self._feedback.async_settle(device_id)
+        await self._async_handle_action(config, queued.action, queued.count)
+
+    # Selection helpers
+
+    def _default_area(self, device_id: str) -> str | None:
+        """Return the area of the remote itself."""
+        device = dr.async_get(self._hass).async_get(device_id)
+        return device.area_id if device else None
+
+    def _current_area(self, config: RemoteConfig) -> str | None:
+        """Return the selected area_id of a remote."""
+        area = self._store.get(config.device_id, KEY_CURRENT_AREA)
+        if area is None:
+            return self._default_area(config.device_id)
+        return area
+
+    def _current_light(self, config: RemoteConfig) -> str:
+        """Return the selected light (or 'all') of a remote."""
+        return self._store.get(config.device_id, KEY_CURRENT_LIGHT, ALL_LIGHTS)
+
+    def _available_areas(self, config: RemoteConfig) -> list[str]:
+        """Return the area_ids to cycle through."""
+        excluded = set(config.excluded_areas)
+        return [
+            area_id for area_id in self._area_index.areas() if area_id not in excluded
+        ]
+
+    def _area_lights(self, area_id: str | None) -> list[str]:
+        """Return the light entities in an area, including those via devices."""
+        return self._area_index.lights(area_id)
+
+    def _targets(self, config: RemoteConfig) -> list[str]:
+        """Return the lights the remote currently controls."""
+        current_light = self._current_light(config)
+        if current_light != ALL_LIGHTS:
+            return [current_light]
+        return self._area_lights(self._current_area(config))
+
+    def _current_mireds(self, entity_id: str) -> int:
+        """Return the last known colour temperature of a light in mireds."""
+        snapshot = self._capabilities.snapshot(entity_id)
+        if snapshot is None or snapshot.mireds is None:
+            return DEFAULT_COLOR_TEMP_MIREDS
+        return snapshot.mireds
+
+    # Service helpers
+
+    @callback
+    def _async_light(self, service: str, entity_ids: list[str], **data: Any) -> None:
+        """Send a light service call for a list of entities.
+
+        The lights are split into buckets by what they support, with one call
+        per bucket (group-cast if possible). The calls go through the
+        per-target command slots, where they supersede commands for the same
+        target that were not sent yet and are ordered per light.
+        """
+        plan = self._capabilities.plan(entity_ids, data)
+        if not plan:
+            return
+        self._metrics.mark("dispatch")
+        for bucket, bucket_data in plan:
+            self._commands.async_send(
+                service,
+                self._group_caster.async_resolve(bucket),
+                bucket_data,
+                lights=bucket,
+            )
+
+    @callback
+    def _async_set_color_temp(
+        self, entity_ids: list[str], mireds: int, **data: Any
+    ) -> None:
+        """Set the colour temperature of lights, given in mireds."""
+        self._async_light(
+            "turn_on",
+            entity_ids,
+            color_temp_kelvin=color_util.color_temperature_mired_to_kelvin(mireds),
+            **data,
+        )
+        self._capabilities.async_assume(entity_ids, mireds)
+
+    @callback
+    def _async_step_color_temp(
+        self, entity_ids: list[str], next_mireds: Callable[[int], int]
+    ) -> None:
+        """Move the colour temperature of each light relative to its own.
+
+        Lights that end up at the same temperature share one command.
+        """
+        by_mireds: dict[int, list[str]] = {}
+        for entity_id in entity_ids:
+            mireds = next_mireds(self._current_mireds(entity_id))
+            by_mireds.setdefault(mireds, []).append(entity_id)
+        for mireds, lights in by_mireds.items():
+            self._async_set_color_temp(lights, mireds)
+
+    @callback
+    def _async_blink(
+        self, config: RemoteConfig, entity_ids: list[str], count: int = 2
+    ) -> None:
+        """Blink lights to confirm a selection (without waiting for it)."""
+        if entity_ids:
+            self._feedback.async_blink(config.device_id, entity_ids, count)
+
+    # Actions
+
+    async def _async_handle_action(
+        self, config: RemoteConfig, action: str, count: int = 1
+    ) -> None:
+        """Run the behaviour bound to an action (pressed count times)."""
+        device_id = config.device_id
+
+        if action == "refresh":
+            await self._async_cycle_area(config)
+        elif action == "color_cycle":
+            await self._async_cycle_light(config)
+        elif action == "color_cycle_long":
+            await self._async_save_scene(config)
+        elif action == "turn_on":
+            if config.power_left_entity:
+                await self._hass.services.async_call(
+                    "homeassistant",
+                    "toggle",
+                    {ATTR_ENTITY_ID: config.power_left_entity},
+                    blocking=True,
+                )
+        elif action == "turn_off":
+            self._async_light("toggle", self._targets(config))
+        elif action in COLOR_HS:
+            self._async_light(
+                "turn_on", self._targets(config), hs_color=COLOR_HS[action]
+            )
+        elif action in COLOR_TEMP_RANGES:
+            min_temp, max_temp = COLOR_TEMP_RANGES[action]
+            self._async_step_color_temp(
+                self._targets(config),
+                lambda current: (
+                    min_temp
+                    if current < min_temp or current >= max_temp
+                    else current + COLOR_TEMP_CYCLE_STEP_MIREDS
+                ),
+            )
+        elif action in ("dim_up", "dim_down"):
+            step = min(100, DIM_STEP_PCT * count)
+            if action == "dim_down":
+                step = -step
+            self._async_light(
+                "turn_on", self._targets(config), brightness_step_pct=step
+            )
+        elif action in ("dim_up_long", "dim_down_long"):
+            level = 254 if action == "dim_up_long" else 1
+            self._async_light(
+                "turn_on", self._targets(config), brightness=level, transition=2
+            )
+        elif action in ("color_temp_up", "color_temp_down"):
+            step = COLOR_TEMP_STEP_MIREDS * count
+            if action == "color_temp_up":
+                step = -step
+            self._async_step_color_temp(
+                self._targets(config),
+                lambda current: max(MIN_MIREDS, min(MAX_MIREDS, current + step)),
+            )
+        elif action in ("color_temp_up_long", "color_temp_down_long"):
+            mireds = MIN_MIREDS if action == "color_temp_up_long" else MAX_MIREDS
+            self._async_set_color_temp(
+                self._targets(config), mireds, transition=1
+            )
+        elif action in ("scene_1", "scene_2"):
+            scene = (
+                "scene.eglo_remote_default_area_state"
+                if action == "scene_1"
+                else "scene.eglo_remote_default_light_state"
+            )
+            if self._hass.states.get(scene) is not None:
+                await self._hass.services.async_call(
+                    "scene", "turn_on", {ATTR_ENTITY_ID: scene}, blocking=True
+                )
+        else:
+            _LOGGER.debug("No native handler for %s on %s", action, device_id)
+
+    async def _async_cycle_area(self, config: RemoteConfig) -> None:
+        """Select the whole area, or move on to the next area."""
+        device_id = config.device_id
+        current_area = self._current_area(config)
+
+        if self._current_light(config) != ALL_LIGHTS:
+            # First press after a single light selects the whole area again
+            self._store.async_set(device_id, KEY_CURRENT_LIGHT, ALL_LIGHTS)
+            self._async_blink(config, self._area_lights(current_area))
+            return
+
+        areas = self._available_areas(config)
+        if areas:
+            index = areas.index(current_area) if current_area in areas else -1
+            next_area = areas[(index + 1) % len(areas)]
+        else:
+            next_area = self._default_area(device_id)
+
+        self._store.async_update(
+            device_id, {KEY_CURRENT_AREA: next_area, KEY_CURRENT_LIGHT: ALL_LIGHTS}
+        )
+        self._async_blink(config, self._area_lights(next_area))
+
+    async def _async_cycle_light(self, config: RemoteConfig) -> None:
+        """Select the next light in the current area ('all' first)."""
+        area_lights = self._area_lights(self._current_area(config))
+        options = [ALL_LIGHTS, *area_lights]
+        current_light = self._current_light(config)
+        index = options.index(current_light) if current_light in options else 0
+        next_light = options[(index + 1) % len(options)]
+
+        self._store.async_set(config.device_id, KEY_CURRENT_LIGHT, next_light)
+        self._async_blink(
+            config, [next_light] if next_light != ALL_LIGHTS else area_lights
+        )
+
+    async def _async_save_scene(self, config: RemoteConfig) -> None:
+        """Snapshot the current targets as the default scene."""
+        targets = self._targets(config)
+        if not targets:
+            return
+        kind = "light" if self._current_light(config) != ALL_LIGHTS else "area"
+        await self._hass.services.async_call(
+            "scene",
+            "create",
+            {
+                "scene_id": f"eglo_remote_default_{kind}_state",
+                "snapshot_entities": targets,
+            },
+            blocking=True,
+        )
+        self._async_blink(config, targets, count=3)
+
+    # Inactivity timeout
+
+    @callback
+    def _async_arm_timeout(
+        self, config: RemoteConfig, last_activity: datetime
+    ) -> None:
+        """(Re-)arm the inactivity timeout of a remote."""
+        self._async_cancel_timeout(config.device_id)
+        if config.timeout_minutes <= 0:
+            return
+
+        deadline = last_activity + timedelta(minutes=config.timeout_minutes)
+        delay = max(0.0, (deadline - dt_util.utcnow()).total_seconds())
+        self._timeouts[config.device_id] = async_call_later(
+            self._hass,
+            delay,
+            HassJob(
+                partial(self._async_timeout_fired, config.device_id),
+                "eglo_remote_zha inactivity timeout",
+                cancel_on_shutdown=True,
+            ),
+        )
+
+    @callback
+    def _async_cancel_timeout(self, device_id: str) -> None:
+        """Cancel the armed inactivity timeout of a remote, if any."""
+        if (cancel := self._timeouts.pop(device_id, None)) is not None:
+            cancel()
+
+    @callback
+    def _async_timeout_fired(self, device_id: str, _now: datetime) -> None:
+        """Reset a remote to its default area after inactivity."""
+        self._timeouts.pop(device_id, None)
+        config = self._remotes.get(device_id)
+        if config is None:
+            return
+
+        default_area = self._default_area(device_id)
+        if (
+            self._current_area(config) == default_area
+            and self._current_light(config) == ALL_LIGHTS
+        ):
+            return
+
+        self._store.async_update(
+            device_id,
+            {KEY_CURRENT_AREA: default_area, KEY_CURRENT_LIGHT: ALL_LIGHTS},
+        )
+        _LOGGER.debug("Remote %s timed out, reset to default area", device_id)
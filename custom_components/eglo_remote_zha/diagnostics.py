@@ -0,0 +1,61 @@
+"""Diagnostics support for Eglo Remote ZHA."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import BANK_QUIRK_MODULE, DOMAIN
+from .quirk_loader import IMPORT_MS
+
+# Quirk modules that count suppressed duplicate frames
+DEDUP_QUIRK_MODULES = {
+    "eglo_ercu_awox": f"{__package__}.eglo_ercu_awox",
+    "eglo_ercu_awox_3banks": BANK_QUIRK_MODULE,
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return setup timings, loaded quirks, runtime counters and frame trace."""
+    data = hass.data.get(DOMAIN, {})
+    bank_quirk = sys.modules.get(BANK_QUIRK_MODULE)
+
+    return {
+        "timings": {
+            "setup_ms": data.get("setup_ms"),
+            "quirk_import_ms": dict(IMPORT_MS),
+        },
+        "remotes": {
+            "registered": sorted(data["controller"].remotes)
+            if "controller" in data
+            else [],
+            "queues": data["controller"].queue_metrics if "controller" in data else {},
+        },
+        "metrics": {
+            name: data[key].metrics
+            for name, key in (
+                ("storage", "store"),
+                ("group_cast", "group_caster"),
+                ("feedback", "feedback"),
+                ("capabilities", "capabilities"),
+                ("commands", "commands"),
+            )
+            if key in data
+        },
+        "duplicates_suppressed": {
+            name: dict(getattr(sys.modules.get(module), "DUPLICATES_SUPPRESSED", {}))
+            for name, module in DEDUP_QUIRK_MODULES.items()
+        },
+        "presses": data["press_metrics"].as_dict() if "press_metrics" in data else {},
+        # Frames recorded by the 3-bank quirk since frame_trace enabled it
+        "frame_trace": (
+            bank_quirk.dump_frame_trace()
+            if hasattr(bank_quirk, "dump_frame_trace")
+            else []
+        ),
+    }
@@ -0,0 +1,183 @@
+"""Single zha_event listener that resolves AwoX remote presses to actions.
+
+Rather than every automation evaluating its own event triggers against each
+zha_event on the bus, the integration installs one listener and resolves
+(cluster, command, params) to an action name with a precomputed lookup table
+built from the quirk's device_automation_triggers. Matched presses are
+re-emitted as a compact ``eglo_remote_zha_action`` event and handed directly
+to in-process subscribers such as the native controller.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from functools import cache
+import logging
+import sys
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+
+from zhaquirks.const import CLUSTER_ID, COMMAND, PARAMS
+
+from .const import EVENT_ACTION
+from .metrics import PressMetrics, PressTrace
+
+_LOGGER = logging.getLogger(__name__)
+
+ZHA_EVENT = "zha_event"
+AWOX_MODEL = "ERCU_3groups_Zm"
+
+ActionListener = Callable[[str, str, dict[str, Any], PressTrace], None]
+
+# Frames older than this are not the frame of the event being handled
+FRAME_MAX_AGE = 5.0
+
+
+class DispatchTable:
+    """Lookup table from (cluster_id, command, params) to a trigger."""
+
+    def __init__(
+        self, triggers: Mapping[tuple[str, str], Mapping[str, Any]]
+    ) -> None:
+        """Build the table from device_automation_triggers."""
+        # (cluster_id, command) -> names of the params that tell triggers apart
+        self._param_names: dict[tuple[int | None, str], tuple[str, ...]] = {}
+        # (cluster_id, command, param values) -> (press_type, action)
+        self._actions: dict[tuple[Any, ...], tuple[str, str]] = {}
+
+        for trigger in triggers.values():
+            key = (trigger.get(CLUSTER_ID), trigger[COMMAND])
+            names = set(self._param_names.get(key, ()))
+            names.update(trigger.get(PARAMS, {}))
+            self._param_names[key] = tuple(sorted(names))
+
+        for (press_type, action), trigger in triggers.items():
+            key = (trigger.get(CLUSTER_ID), trigger[COMMAND])
+            params = trigger.get(PARAMS, {})
+            values = tuple(params.get(name) for name in self._param_names[key])
+            self._actions[(*key, values)] = (press_type, action)
+
+    def __len__(self) -> int:
+        """Return the number of actions in the table."""
+        return len(self._actions)
+
+    def lookup(
+        self, cluster_id: int | None, command: str, params: Mapping[str, Any]
+    ) -> tuple[str, str] | None:
+        """Return (press_type, action) for a received command, if any."""
+        key = (cluster_id, command)
+        names = self._param_names.get(key)
+        if names is None:
+            return None
+        return self._actions.get((*key, tuple(params.get(name) for name in names)))
+
+
+@cache
+def awox_dispatch_table() -> DispatchTable:
+    """Return the AwoX table (importing the quirk on first use)."""
+    from .eglo_ercu_awox import Awox99099Remote
+
+    return DispatchTable(Awox99099Remote.device_automation_triggers)
+
+
+class ActionDispatcher:
+    """Resolve zha_events of AwoX remotes and re-emit them as actions."""
+
+    def __init__(self, hass: HomeAssistant, metrics: PressMetrics) -> None:
+        """Initialize the dispatcher."""
+        self._hass = hass
+        self._metrics = metrics
+        self._listeners: list[ActionListener] = []
+        # device_id -> whether it is an AwoX remote
+        self._is_remote: dict[str, bool] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Install the zha_event listener."""
+        self._unsubs.append(
+            self._hass.bus.async_listen(
+                ZHA_EVENT, self._async_handle_zha_event, event_filter=self._event_filter
+            )
+        )
+        self._unsubs.append(
+            self._hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_updated
+            )
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Remove all listeners."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    @callback
+    def async_subscribe(self, listener: ActionListener) -> CALLBACK_TYPE:
+        """Call listener(device_id, action, event_data, trace) for every press."""
+        self._listeners.append(listener)
+
+        @callback
+        def _unsubscribe() -> None:
+            self._listeners.remove(listener)
+
+        return _unsubscribe
+
+    @callback
+    def _async_device_updated(self, event: Event) -> None:
+        """Forget cached device classification on registry changes."""
+        self._is_remote.pop(event.data["device_id"], None)
+
+    @callback
+    def _event_filter(self, event_data: Mapping[str, Any]) -> bool:
+        """Only pass zha_events coming from AwoX remotes."""
+        device_id = event_data.get("device_id")
+        if device_id is None:
+            return False
+        is_remote = self._is_remote.get(device_id)
+        if is_remote is None:
+            device = dr.async_get(self._hass).async_get(device_id)
+            is_remote = device is not None and device.model == AWOX_MODEL
+            self._is_remote[device_id] = is_remote
+        return is_remote
+
+    @callback
+    def _frame_received_at(self, device_ieee: str | None, now: float) -> float:
+        """Return when the quirk received the frame of a press (or now)."""
+        quirk = sys.modules.get(f"{__package__}.eglo_ercu_awox")
+        received = getattr(quirk, "FRAME_RECEIVED_AT", {}).get(device_ieee)
+        if received is None or not 0 <= now - received <= FRAME_MAX_AGE:
+            return now
+        return received
+
+    @callback
+    def _async_handle_zha_event(self, event: Event) -> None:
+        """Look up the action for a press and emit it."""
+        now = time.monotonic()
+        data = event.data
+        match = awox_dispatch_table().lookup(
+            data.get("cluster_id"), data.get("command", ""), data.get("params") or {}
+        )
+        if match is None:
+            return
+        press_type, action = match
+        device_id = data["device_id"]
+
+        action_data = {
+            "device_id": device_id,
+            "device_ieee": data.get("device_ieee"),
+            "action": action,
+            "press_type": press_type,
+        }
+        trace = self._metrics.start(
+            device_id, action, self._frame_received_at(data.get("device_ieee"), now)
+        )
+        self._metrics.mark("event", trace)
+
+        self._hass.bus.async_fire(EVENT_ACTION, action_data, context=event.context)
+
+        for listener in self._listeners:
+            listener(device_id, action, action_data, trace)
@@ -12,10 +12,18 @@ It emits 22 button events with hardware long-press support:
 Area/light selection is handled by blueprints, not by the quirk.
 No bank suffixes (_1, _2, _3) are used in this simplified version.
 
-Note: Power button long press is detected through ZHA event platform in blueprints,
-not as separate automation triggers.
+The power and Favourite buttons only send a single command, so long press,
+long release and double press for them are synthesized in the custom clusters
+from the cadence of repeated frames while a button is held
+(see PressTimingMixin).
+
+Retransmitted frames (same transaction sequence number) are dropped before
+they become events (see DedupMixin).
 """
 
+import asyncio
+import time
+
 from zigpy.profiles import zha
 from zigpy.quirks import CustomCluster, CustomDevice
 import zigpy.types as t
@@ -42,10 +50,12 @@ from zhaquirks.const import (
     DEVICE_TYPE,
     DIM_DOWN,
     DIM_UP,
+    DOUBLE_PRESS,
     ENDPOINT_ID,
     ENDPOINTS,
     INPUT_CLUSTERS,
     LONG_PRESS,
+    LONG_RELEASE,
     MODELS_INFO,
     OUTPUT_CLUSTERS,
     PARAMS,
@@ -53,6 +63,7 @@ from zhaquirks.const import (
     SHORT_PRESS,
     TURN_OFF,
     TURN_ON,
+    ZHA_SEND_EVENT,
 )
 
 COMMAND_AWOX_COLOR = "awox_color"
@@ -62,11 +73,259 @@ COMMAND_MOVE_TO_COLOR_TEMP = "move_to_color_temp"
 COMMAND_MOVE_TO_HUE_SATURATION = "move_to_hue_and_saturation"
 COMMAND_RECALL = "recall"
 
+# Event commands emitted by PressTimingMixin, suffixed to the button name
+PRESS_LONG = "long_press"
+PRESS_LONG_RELEASE = "long_release"
+PRESS_DOUBLE = "double_press"
+
+
+# DUPLICATES_SUPPRESSED, _FrameRing and DedupMixin are copied into
+# quirks/eglo_ercu_awox_3banks.py, which is installed as a standalone file and
+# cannot import from the integration. Keep the two copies in sync.
+
+# ieee -> duplicate frames dropped by DedupMixin, for diagnostics
+DUPLICATES_SUPPRESSED: dict[str, int] = {}
+
+
+class _FrameRing:
+    """Fixed-size ring of the frames a device handled recently."""
+
+    __slots__ = ("keys", "times", "index", "suppressed")
+
+    def __init__(self, size: int) -> None:
+        self.keys: list[tuple | None] = [None] * size
+        self.times = [0.0] * size
+        self.index = 0
+        self.suppressed = 0
+
+    def seen(self, key: tuple, now: float, window: float) -> bool:
+        """Return True for a repeat of a recent frame, else remember it."""
+        for slot, slot_key in enumerate(self.keys):
+            if slot_key == key and now - self.times[slot] <= window:
+                self.suppressed += 1
+                return True
+        self.keys[self.index] = key
+        self.times[self.index] = now
+        self.index = (self.index + 1) % len(self.keys)
+        return False
+
+
+class DedupMixin:
+    """Drop retransmitted and repeated frames of a single press.
+
+    The remote retransmits frames and may deliver a press both as a
+    group-cast and as a repeated frame, all with the same ZCL transaction
+    sequence number. A frame whose (cluster, TSN, command) was handled by
+    the same device within ``dedup_window`` seconds is dropped before it
+    turns into an event. Held buttons repeat with new TSNs and are not
+    affected. The ring is shared by the device's clusters and never grows.
+    """
+
+    dedup_window = 1.0
+    dedup_ring_size = 8
+
+    def handle_message(self, hdr: foundation.ZCLHeader, args, *rest, **kwargs):
+        """Handle a frame unless it repeats one handled moments ago."""
+        if hdr.frame_control.is_cluster:
+            device = self.endpoint.device
+            ring = getattr(device, "_frame_ring", None)
+            if ring is None:
+                ring = device._frame_ring = _FrameRing(self.dedup_ring_size)
+            key = (self.cluster_id, hdr.tsn, hdr.command_id)
+            if ring.seen(key, time.monotonic(), self.dedup_window):
+                DUPLICATES_SUPPRESSED[str(device.ieee)] = ring.suppressed
+                return None
+        return super().handle_message(hdr, args, *rest, **kwargs)
+
+
+class _ButtonTiming:
+    """Press timing state of a single button."""
+
+    __slots__ = (
+        "first_frame",
+        "last_frame",
+        "held",
+        "long_sent",
+        "double_sent",
+        "released_at",
+        "pending",
+    )
+
+    def __init__(self) -> None:
+        self.first_frame = 0.0
+        self.last_frame = 0.0
+        self.held = False
+        self.long_sent = False
+        self.double_sent = False
+        self.released_at: float | None = None
+        # first frame of a press, held back until it is known to be short
+        self.pending: tuple | None = None
+
+
+class PressTimingMixin:
+    """Synthesize short/long/double presses from the repeat-frame cadence.
+
+    While a button is held the remote keeps repeating its command. Frames
+    closer together than ``repeat_interval`` belong to the same hold; a hold
+    lasting ``long_press_threshold`` emits ``<button>_long_press`` and its end
+    emits ``<button>_long_release``. A new press within
+    ``double_press_window`` of a short press emits ``<button>_double_press``.
+    Each press is exactly one of these: the first frame of a press is held
+    back and only handled as usual (the plain short-press event) once the
+    press has ended without becoming a long press and no second press
+    followed within ``double_press_window``. Short presses of timed buttons
+    are therefore reported up to ``repeat_interval + double_press_window``
+    late. Repeat frames are never handled as usual.
+    Timestamps come from the (monotonic) event loop clock and release
+    detection uses a single re-armed timer handle per button, not a task.
+    """
+
+    repeat_interval = 0.35
+    long_press_threshold = 0.8
+    double_press_window = 0.4
+
+    def _press_button(self, hdr: foundation.ZCLHeader, args) -> str | None:
+        """Return the button a frame belongs to, if it is timed."""
+        return None
+
+    def handle_message(self, hdr: foundation.ZCLHeader, args, *rest, **kwargs):
+        """Hold back the frames of timed buttons, handle the others as usual."""
+        if hdr.frame_control.is_cluster:
+            button = self._press_button(hdr, args)
+            if button is not None:
+                self._press_frame(button, (hdr, args, rest, kwargs))
+                return None
+        return super().handle_message(hdr, args, *rest, **kwargs)
+
+    def _press_timing(self, button: str) -> _ButtonTiming:
+        """Return the timing state of a button."""
+        try:
+            timings = self._button_timings
+        except AttributeError:
+            timings = self._button_timings = {}
+        timing = timings.get(button)
+        if timing is None:
+            timing = timings[button] = _ButtonTiming()
+        return timing
+
+    def _press_frame(self, button: str, frame: tuple) -> None:
+        """Feed a received frame into the button's state machine."""
+        timing = self._press_timing(button)
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+
+        if timing.held and now - timing.last_frame <= self.repeat_interval:
+            # Repeat frame of a held button
+            timing.last_frame = now
+            if (
+                not timing.long_sent
+                and not timing.double_sent
+                and now - timing.first_frame >= self.long_press_threshold
+            ):
+                timing.long_sent = True
+                timing.pending = None
+                self._emit_press(button, PRESS_LONG)
+            return
+
+        if (
+            timing.pending is not None
+            and timing.released_at is not None
+            and now - timing.released_at <= self.double_press_window
+        ):
+            # Second press of a double press; neither press is short
+            timing.pending = None
+            timing.double_sent = True
+            self._emit_press(button, PRESS_DOUBLE)
+        else:
+            # A short press whose window has passed but whose timer has not
+            # run yet goes out first
+            self._flush_press(button)
+            timing.double_sent = False
+            timing.pending = frame
+
+        timing.released_at = None
+        timing.held = True
+        timing.long_sent = False
+        timing.first_frame = timing.last_frame = now
+        loop.call_at(now + self.repeat_interval, self._check_release, button)
+
+    def _check_release(self, button: str) -> None:
+        """Detect the end of a hold once frames stop repeating."""
+        timing = self._button_timings[button]
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        deadline = timing.last_frame + self.repeat_interval
+        if now < deadline:
+            # Still repeating, look again when the latest frame expires
+            loop.call_at(deadline, self._check_release, button)
+            return
+
+        timing.held = False
+        if timing.long_sent:
+            self._emit_press(button, PRESS_LONG_RELEASE)
+        elif timing.pending is not None:
+            timing.released_at = now
+            loop.call_at(
+                now + self.double_press_window,
+                self._check_double,
+                button,
+                timing.pending,
+            )
+
+    def _check_double(self, button: str, frame: tuple) -> None:
+        """Handle a short press once no second press followed it."""
+        if self._button_timings[button].pending is frame:
+            self._flush_press(button)
+
+    def _flush_press(self, button: str) -> None:
+        """Handle the held-back first frame of a short press as usual."""
+        timing = self._button_timings[button]
+        if timing.pending is None:
+            return
+        hdr, args, rest, kwargs = timing.pending
+        timing.pending = None
+        timing.released_at = None
+        super().handle_message(hdr, args, *rest, **kwargs)
+
+    def _emit_press(self, button: str, kind: str) -> None:
+        """Emit a synthesized press event."""
+        self.listener_event(ZHA_SEND_EVENT, f"{button}_{kind}", {"button": button})
+
+
+# ieee -> time.monotonic() of the latest frame from each remote, so the
+# integration can measure press latency from frame arrival
+FRAME_RECEIVED_AT: dict[str, float] = {}
+
 
 class Awox99099Remote(CustomDevice):
     """Custom device representing AwoX 99099 remote (EGLO Remote 2.0)"""
 
-    class AwoxColorCluster(CustomCluster, Color):
+    def packet_received(self, packet: t.ZigbeePacket) -> None:
+        """Note when the frame arrived, then handle it as usual."""
+        FRAME_RECEIVED_AT[str(self.ieee)] = time.monotonic()
+        super().packet_received(packet)
+
+    class AwoxOnOffCluster(DedupMixin, PressTimingMixin, CustomCluster, OnOff):
+        """Awox Remote Custom OnOff Cluster with press timing"""
+
+        def _press_button(self, hdr: foundation.ZCLHeader, args) -> str | None:
+            """Time the power buttons."""
+            if hdr.command_id == OnOff.ServerCommandDefs.on.id:
+                return TURN_ON
+            if hdr.command_id == OnOff.ServerCommandDefs.off.id:
+                return TURN_OFF
+            return None
+
+    class AwoxScenesCluster(DedupMixin, PressTimingMixin, CustomCluster, Scenes):
+        """Awox Remote Custom Scenes Cluster with press timing"""
+
+        def _press_button(self, hdr: foundation.ZCLHeader, args) -> str | None:
+            """Time the Favourite buttons."""
+            if hdr.command_id != Scenes.ServerCommandDefs.recall.id:
+                return None
+            return f"scene_{args.scene_id}"
+
+    class AwoxColorCluster(DedupMixin, CustomCluster, Color):
         """Awox Remote Custom Color Cluster"""
 
         server_commands = Color.server_commands.copy()
@@ -76,7 +335,7 @@ class Awox99099Remote(CustomDevice):
             is_manufacturer_specific=True,
         )
 
-    class AwoxLevelControlCluster(CustomCluster, LevelControl):
+    class AwoxLevelControlCluster(DedupMixin, CustomCluster, LevelControl):
         """Awox Remote Custom LevelControl Cluster"""
 
         server_commands = LevelControl.server_commands.copy()
@@ -147,8 +406,8 @@ class Awox99099Remote(CustomDevice):
                     Basic.cluster_id,
                     Identify.cluster_id,
                     Groups.cluster_id,
-                    Scenes.cluster_id,
-                    OnOff.cluster_id,
+                    AwoxScenesCluster,
+                    AwoxOnOffCluster,
                     AwoxLevelControlCluster,
                     AwoxColorCluster,
                     LightLink.cluster_id,
@@ -173,6 +432,36 @@ class Awox99099Remote(CustomDevice):
         # Power buttons (left=ON, right=OFF) - use constants from zhaquirks.const
         (SHORT_PRESS, TURN_ON): {COMMAND: COMMAND_ON, CLUSTER_ID: 6, ENDPOINT_ID: 1},
         (SHORT_PRESS, TURN_OFF): {COMMAND: COMMAND_OFF, CLUSTER_ID: 6, ENDPOINT_ID: 1},
+        (LONG_PRESS, "turn_on_long"): {
+            COMMAND: f"{TURN_ON}_{PRESS_LONG}",
+            CLUSTER_ID: 6,
+            ENDPOINT_ID: 1,
+        },
+        (LONG_RELEASE, "turn_on_long_release"): {
+            COMMAND: f"{TURN_ON}_{PRESS_LONG_RELEASE}",
+            CLUSTER_ID: 6,
+            ENDPOINT_ID: 1,
+        },
+        (DOUBLE_PRESS, "turn_on_double"): {
+            COMMAND: f"{TURN_ON}_{PRESS_DOUBLE}",
+            CLUSTER_ID: 6,
+            ENDPOINT_ID: 1,
+        },
+        (LONG_PRESS, "turn_off_long"): {
+            COMMAND: f"{TURN_OFF}_{PRESS_LONG}",
+            CLUSTER_ID: 6,
+            ENDPOINT_ID: 1,
+        },
+        (LONG_RELEASE, "turn_off_long_release"): {
+            COMMAND: f"{TURN_OFF}_{PRESS_LONG_RELEASE}",
+            CLUSTER_ID: 6,
+            ENDPOINT_ID: 1,
+        },
+        (DOUBLE_PRESS, "turn_off_double"): {
+            COMMAND: f"{TURN_OFF}_{PRESS_DOUBLE}",
+            CLUSTER_ID: 6,
+            ENDPOINT_ID: 1,
+        },
         
         # Color buttons (Colour top=green, left=red, right=blue, middle=cycle)
         (SHORT_PRESS, "color_green"): {
@@ -277,6 +566,36 @@ class Awox99099Remote(CustomDevice):
             ENDPOINT_ID: 1,
             PARAMS: {"scene_id": 2},
         },
+        (LONG_PRESS, "scene_1_long"): {
+            COMMAND: f"scene_1_{PRESS_LONG}",
+            CLUSTER_ID: 5,
+            ENDPOINT_ID: 1,
+        },
+        (LONG_RELEASE, "scene_1_long_release"): {
+            COMMAND: f"scene_1_{PRESS_LONG_RELEASE}",
+            CLUSTER_ID: 5,
+            ENDPOINT_ID: 1,
+        },
+        (DOUBLE_PRESS, "scene_1_double"): {
+            COMMAND: f"scene_1_{PRESS_DOUBLE}",
+            CLUSTER_ID: 5,
+            ENDPOINT_ID: 1,
+        },
+        (LONG_PRESS, "scene_2_long"): {
+            COMMAND: f"scene_2_{PRESS_LONG}",
+            CLUSTER_ID: 5,
+            ENDPOINT_ID: 1,
+        },
+        (LONG_RELEASE, "scene_2_long_release"): {
+            COMMAND: f"scene_2_{PRESS_LONG_RELEASE}",
+            CLUSTER_ID: 5,
+            ENDPOINT_ID: 1,
+        },
+        (DOUBLE_PRESS, "scene_2_double"): {
+            COMMAND: f"scene_2_{PRESS_DOUBLE}",
+            CLUSTER_ID: 5,
+            ENDPOINT_ID: 1,
+        },
         
         # Color temperature buttons (white tone selection)
         (SHORT_PRESS, "color_temp_up"): {
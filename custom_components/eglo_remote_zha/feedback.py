@@ -0,0 +1,176 @@
+"""Coalescing blink scheduler for selection feedback.
+
+Blinks run as background tasks, so a press does not wait for its feedback to
+finish. Each blink is keyed (per remote): a new blink for the same key
+cancels the one in flight instead of queueing behind it. Every light's state
+is captured before its first blink and restored afterwards, including lights
+whose blink was cut short. Lights that support ``flash`` (ZHA lights map it to
+the Identify cluster's blink effect) flash instead of being switched.
+Before a remote commands lights it settles its running blink, which restores
+the lights right away, so the end of the blink does not undo the command.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+from homeassistant.components.light import ATTR_FLASH, FLASH_SHORT, LightEntityFeature
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_SUPPORTED_FEATURES
+from homeassistant.core import HomeAssistant, State, callback
+
+from .group_cast import GroupCaster
+
+_LOGGER = logging.getLogger(__name__)
+
+BLINK_ON_MS = 200
+BLINK_OFF_MS = 200
+
+# Attributes that are not part of a light's reproducible state
+_RESTORE_EXCLUDE = {"friendly_name", "supported_features", "supported_color_modes"}
+
+
+@dataclass
+class _Blink:
+    """A blink in flight for one key."""
+
+    task: asyncio.Task
+    # entity_id -> state captured before the first blink touched it
+    snapshot: dict[str, State] = field(default_factory=dict)
+
+
+class BlinkScheduler:
+    """Schedule blink patterns and restore the lights afterwards."""
+
+    def __init__(self, hass: HomeAssistant, group_caster: GroupCaster) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._group_caster = group_caster
+        self._blinks: dict[Any, _Blink] = {}
+        self._coalesced = 0
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """Return blink counters."""
+        return {"active": len(self._blinks), "coalesced": self._coalesced}
+
+    @callback
+    def async_blink(self, key: Any, entity_ids: list[str], count: int = 2) -> None:
+        """Blink lights, replacing any blink still running for key."""
+        snapshot: dict[str, State] = {}
+        if (previous := self._blinks.pop(key, None)) is not None:
+            # Keep the pre-blink states; the current ones are mid-blink
+            previous.task.cancel()
+            snapshot = previous.snapshot
+            self._coalesced += 1
+        for entity_id in entity_ids:
+            if entity_id not in snapshot and (
+                state := self._hass.states.get(entity_id)
+            ):
+                snapshot[entity_id] = state
+
+        blink = _Blink(
+            task=self._hass.async_create_background_task(
+                self._async_run(key, entity_ids, count, snapshot),
+                f"eglo_remote_zha blink {key}",
+            ),
+            snapshot=snapshot,
+        )
+        self._blinks[key] = blink
+
+    async def async_settle(self, key: Any) -> None:
+        """End the blink running for key and restore its lights now."""
+        if (blink := self._blinks.pop(key, None)) is None:
+            return
+        blink.task.cancel()
+        await asyncio.wait([blink.task])
+        await self._async_restore(blink.snapshot)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel all blinks (their lights are left as they are)."""
+        for blink in self._blinks.values():
+            blink.task.cancel()
+        self._blinks.clear()
+
+    async def _async_run(
+        self,
+        key: Any,
+        entity_ids: list[str],
+        count: int,
+        snapshot: dict[str, State],
+    ) -> None:
+        """Blink lights count times, then restore them."""
+        # Lights left over from a cut-short blink go back right away
+        await self._async_restore(
+            {
+                entity_id: state
+                for entity_id, state in snapshot.items()
+                if entity_id not in entity_ids
+            }
+        )
+
+        flash: list[str] = []
+        switch: list[str] = []
+        for entity_id in entity_ids:
+            state = snapshot.get(entity_id)
+            features = state.attributes.get(ATTR_SUPPORTED_FEATURES, 0) if state else 0
+            (flash if features & LightEntityFeature.FLASH else switch).append(
+                entity_id
+            )
+
+        try:
+            for _ in range(count):
+                if flash:
+                    await self._async_light(
+                        "turn_on", flash, **{ATTR_FLASH: FLASH_SHORT}
+                    )
+                if switch:
+                    await self._async_light("turn_on", switch, brightness_pct=100)
+                await asyncio.sleep(BLINK_ON_MS / 1000)
+                if switch:
+                    await self._async_light("turn_off", switch)
+                await asyncio.sleep(BLINK_OFF_MS / 1000)
+        finally:
+            blink = self._blinks.get(key)
+            if blink is not None and blink.task is asyncio.current_task():
+                del self._blinks[key]
+                await self._async_restore(
+                    {
+                        entity_id: state
+                        for entity_id, state in snapshot.items()
+                        if entity_id in entity_ids
+                    }
+                )
+
+    async def _async_restore(self, snapshot: dict[str, State]) -> None:
+        """Put lights back into their captured state."""
+        if not snapshot:
+            return
+        entities = {
+            entity_id: {
+                "state": state.state,
+                **{
+                    name: value
+                    for name, value in state.attributes.items()
+                    if name not in _RESTORE_EXCLUDE
+                },
+            }
+            for entity_id, state in snapshot.items()
+        }
+        await self._hass.services.async_call(
+            "scene", "apply", {"entities": entities}, blocking=True
+        )
+
+    async def _async_light(
+        self, service: str, entity_ids: list[str], **data: Any
+    ) -> None:
+        """Call a light service for a list of entities (group-cast if possible)."""
+        await self._hass.services.async_call(
+            "light",
+            service,
+            {ATTR_ENTITY_ID: self._group_caster.async_resolve(entity_ids), **data},
+            blocking=True,
+        )
@@ -0,0 +1,286 @@
+"""Zigbee group-cast fast path for whole-area targets.
+
+When a target set is all the lights of an area and several of them are ZHA
+lights, the integration keeps a ZHA group with exactly those members and
+addresses the group's light entity instead of each bulb, so a press is a
+single group-cast on the mesh rather than one unicast per light. There is at
+most one group per area, named after it, and its membership is refreshed
+when the area changes. The ids of the groups created here are stored, so
+groups made by hand are never touched; created groups of areas that no
+longer exist are removed on start. Other light sets, lights that are not ZHA
+lights, and areas whose group or group entity does not exist yet fall back to
+per-entity calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+import logging
+from typing import Any
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
+
+from .area_index import AreaLightIndex
+from .const import GROUP_STORAGE_KEY, GROUP_STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+ZHA_DOMAIN = "zha"
+LIGHT_DOMAIN = "light"
+
+GROUP_NAME_PREFIX = "Eglo Remote "
+
+# Smallest number of ZHA lights worth addressing as a group
+MIN_GROUP_LIGHTS = 2
+
+
+class GroupCaster:
+    """Resolve light targets to ZHA group entities where possible."""
+
+    def __init__(self, hass: HomeAssistant, area_index: AreaLightIndex) -> None:
+        """Initialize the caster."""
+        self._hass = hass
+        self._area_index = area_index
+        self._store: Store[dict[str, int]] = Store(
+            hass, GROUP_STORAGE_VERSION, GROUP_STORAGE_KEY
+        )
+        # name -> group_id of the groups created by this integration
+        self._group_ids: dict[str, int] = {}
+        # group names with a create/refresh task in flight
+        self._pending: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._group_casts = 0
+        self._unicasts = 0
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """Return group-cast counters."""
+        return {
+            "group_casts": self._group_casts,
+            "unicasts": self._unicasts,
+            "pending_groups": len(self._pending),
+        }
+
+    async def async_start(self) -> None:
+        """Load the created groups and remove stale ones in the background."""
+        self._group_ids = await self._store.async_load() or {}
+        self._async_background(
+            self._async_remove_stale_groups(), "eglo_remote_zha stale groups"
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the group tasks still running."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        self._pending.clear()
+
+    @callback
+    def async_resolve(self, entity_ids: list[str]) -> list[str]:
+        """Return the entities to address for a set of lights."""
+        name = self._area_group_name(entity_ids)
+        members = self.zha_members(entity_ids) if name is not None else {}
+        if len(members) < MIN_GROUP_LIGHTS:
+            self._unicasts += len(entity_ids)
+            return entity_ids
+
+        group_entity = self._group_entity(name, set(members.values()))
+        if group_entity is None:
+            self._async_ensure_group(name, set(members.values()))
+            self._unicasts += len(entity_ids)
+            return entity_ids
+
+        others = [entity_id for entity_id in entity_ids if entity_id not in members]
+        self._group_casts += 1
+        self._unicasts += len(others)
+        return [group_entity, *others]
+
+    @callback
+    def zha_members(self, entity_ids: list[str]) -> dict[str, tuple[str, int]]:
+        """Return entity_id -> (ieee, endpoint_id) for the ZHA lights."""
+        ent_reg = er.async_get(self._hass)
+        members: dict[str, tuple[str, int]] = {}
+        for entity_id in entity_ids:
+            entry = ent_reg.async_get(entity_id)
+            if (
+                entry is None
+                or entry.platform != ZHA_DOMAIN
+                or entry.domain != LIGHT_DOMAIN
+            ):
+                continue
+            # ZHA device entities use "<ieee>-<endpoint_id>[-...]" unique_ids;
+            # group entities do not and are never nested
+            ieee, _, rest = entry.unique_id.partition("-")
+            endpoint_id = rest.split("-", 1)[0]
+            if ieee.count(":") != 7 or not endpoint_id.isdigit():
+                continue
+            members[entity_id] = (ieee, int(endpoint_id))
+        return members
+
+    @callback
+    def _area_group_name(self, entity_ids: list[str]) -> str | None:
+        """Return the ZHA group name if the lights are a whole area."""
+        if not entity_ids:
+            return None
+        area_id = self._area_index.area_of(entity_ids[0])
+        if area_id is None or set(self._area_index.lights(area_id)) != set(
+            entity_ids
+        ):
+            return None
+        return f"{GROUP_NAME_PREFIX}{area_id}"
+
+    @callback
+    def _group_entity(self, name: str, members: set[tuple[str, int]]) -> str | None:
+        """Return the light entity of an up-to-date ZHA group, if there is one."""
+        group = self._find_group(name)
+        if group is None or _group_members(group) != members:
+            return None
+        entity_id = er.async_get(self._hass).async_get_entity_id(
+            LIGHT_DOMAIN, ZHA_DOMAIN, f"light_zha_group_0x{group.group_id:04x}"
+        )
+        if entity_id is None:
+            return None
+        state = self._hass.states.get(entity_id)
+        if state is None or state.state == STATE_UNAVAILABLE:
+            return None
+        return entity_id
+
+    @callback
+    def _find_group(self, name: str) -> Any | None:
+        """Return the ZHA group created under a name, if ZHA is loaded."""
+        if (group_id := self._group_ids.get(name)) is None:
+            return None
+        try:
+            from homeassistant.components.zha.helpers import get_zha_gateway
+
+            gateway = get_zha_gateway(self._hass)
+        except (ImportError, KeyError, ValueError):
+            return None
+        return gateway.groups.get(group_id)
+
+    @callback
+    def _async_background(self, target: Coroutine[Any, Any, None], name: str) -> None:
+        """Run a group task in the background until it is done or stopped."""
+        task = self._hass.async_create_background_task(target, name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @callback
+    def _async_ensure_group(self, name: str, members: set[tuple[str, int]]) -> None:
+        """Create or refresh a ZHA group in the background."""
+        if name in self._pending:
+            return
+        self._pending.add(name)
+        self._async_background(
+            self._async_sync_group(name, members), f"eglo_remote_zha group {name}"
+        )
+
+    async def _async_sync_group(
+        self, name: str, members: set[tuple[str, int]]
+    ) -> None:
+        """Create or refresh a group, falling back to per-light commands."""
+        try:
+            await self.async_sync_group(name, members)
+        except Exception:  # noqa: BLE001
+            _LOGGER.warning(
+                "Could not create or refresh ZHA group %s, using per-light commands",
+                name,
+                exc_info=True,
+            )
+        finally:
+            self._pending.discard(name)
+
+    async def async_sync_group(
+        self,
+        name: str,
+        members: set[tuple[str, int]],
+        group_id: int | None = None,
+    ) -> None:
+        """Make a ZHA group have exactly the given (ieee, endpoint_id) members.
+
+        The group is looked up by group_id if one is given, else among the
+        groups created under name, and created if it does not exist yet (its
+        id is stored if none was given). Raises if ZHA is not loaded.
+        """
+        from homeassistant.components.zha.helpers import get_zha_gateway
+        from zha.zigbee.group import GroupMemberReference
+        from zigpy.types import EUI64
+
+        gateway = get_zha_gateway(self._hass)
+        references = {
+            member: GroupMemberReference(
+                ieee=EUI64.convert(member[0]), endpoint_id=member[1]
+            )
+            for member in members
+        }
+
+        group = (
+            gateway.groups.get(group_id)
+            if group_id is not None
+            else self._find_group(name)
+        )
+        if group is None:
+            group = await gateway.async_create_zigpy_group(
+                name, list(references.values()), group_id=group_id
+            )
+            if group_id is None and group is not None:
+                self._group_ids[name] = group.group_id
+                await self._store.async_save(self._group_ids)
+            _LOGGER.debug("Created ZHA group %s with %d light(s)", name, len(members))
+            return
+
+        current = _group_members(group)
+        if added := members - current:
+            await group.async_add_members([references[member] for member in added])
+        if removed := current - members:
+            await group.async_remove_members(
+                [
+                    GroupMemberReference(
+                        ieee=EUI64.convert(member[0]), endpoint_id=member[1]
+                    )
+                    for member in removed
+                ]
+            )
+        _LOGGER.debug(
+            "Refreshed ZHA group %s (+%d/-%d)", name, len(added), len(removed)
+        )
+
+    async def _async_remove_stale_groups(self) -> None:
+        """Remove the created groups that no area maps to any more."""
+        try:
+            from homeassistant.components.zha.helpers import get_zha_gateway
+
+            gateway = get_zha_gateway(self._hass)
+        except (ImportError, KeyError, ValueError):
+            return
+        wanted = {
+            f"{GROUP_NAME_PREFIX}{area_id}" for area_id in self._area_index.areas()
+        }
+        stale = {
+            name: group_id
+            for name, group_id in self._group_ids.items()
+            if name not in wanted
+        }
+        for name, group_id in stale.items():
+            if group_id in gateway.groups:
+                try:
+                    await gateway.async_remove_zigpy_group(group_id)
+                except Exception:  # noqa: BLE001
+                    _LOGGER.warning(
+                        "Could not remove stale ZHA group %s", name, exc_info=True
+                    )
+                    continue
+                _LOGGER.debug("Removed stale ZHA group %s", name)
+            del self._group_ids[name]
+        if stale:
+            await self._store.async_save(self._group_ids)
+
+
+def _group_members(group: Any) -> set[tuple[str, int]]:
+    """Return the (ieee, endpoint_id) members of a ZHA group."""
+    return {(str(member.device.ieee), member.endpoint_id) for member in group.members}
@@ -0,0 +1,132 @@
+"""Native handling of the Tuya TS004F 3-group remote (EgloERCU3Groups).
+
+Short presses switch light group 1 on/off, and long presses (LevelControl
+``move``) start a hold-to-dim ramp that is stopped by the ``stop`` sent on
+release, so dimming costs two commands per light instead of one service call
+every 250 ms for as long as the button is held.
+
+The quirk reports the buttons of all three groups on endpoint 1 with the same
+commands, so presses cannot be told apart by group; only group 1 is handled
+natively until the quirk can tell the buttons apart.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+from .ramp import MAX_BRIGHTNESS, RampEngine
+
+_LOGGER = logging.getLogger(__name__)
+
+ZHA_EVENT = "zha_event"
+
+ONOFF_CLUSTER_ID = 6
+LEVEL_CLUSTER_ID = 8
+
+MOVE_COMMANDS = ("move", "move_with_on_off")
+STOP_COMMANDS = ("stop", "stop_with_on_off")
+
+# A brightness_step of N % per 250 ms in the old blueprint is N * 4 %/s
+DEFAULT_BRIGHTNESS_STEP = 10
+
+
+@dataclass
+class GroupRemoteConfig:
+    """Native handling settings of one 3-group remote."""
+
+    device_id: str
+    # light entity_ids of group 1
+    lights: list[str] = field(default_factory=list)
+    brightness_step: int = DEFAULT_BRIGHTNESS_STEP
+
+    @property
+    def rate(self) -> float:
+        """Return the ramp rate in brightness units per second."""
+        return self.brightness_step * 4 / 100 * MAX_BRIGHTNESS
+
+
+class GroupRemoteController:
+    """Switch and dim light group 1 of registered 3-group remotes."""
+
+    def __init__(self, hass: HomeAssistant, ramp: RampEngine) -> None:
+        """Initialize the controller."""
+        self._hass = hass
+        self._ramp = ramp
+        self._remotes: dict[str, GroupRemoteConfig] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Install the zha_event listener."""
+        self._unsub = self._hass.bus.async_listen(
+            ZHA_EVENT, self._async_handle_zha_event, event_filter=self._event_filter
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Remove the listener and stop all ramps."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._ramp.async_shutdown()
+
+    @callback
+    def async_register(self, config: GroupRemoteConfig) -> None:
+        """Handle presses of a remote natively."""
+        self._remotes[config.device_id] = config
+        _LOGGER.debug(
+            "Registered 3-group remote %s: %s", config.device_id, config.lights
+        )
+
+    @callback
+    def async_unregister(self, device_id: str) -> None:
+        """Stop handling presses of a remote."""
+        self._remotes.pop(device_id, None)
+
+    @callback
+    def _event_filter(self, event_data: Mapping[str, Any]) -> bool:
+        """Only pass zha_events of registered remotes."""
+        return event_data.get("device_id") in self._remotes
+
+    async def _async_handle_zha_event(self, event: Event) -> None:
+        """Switch or dim light group 1."""
+        data = event.data
+        config = self._remotes.get(data["device_id"])
+        if config is None or not config.lights:
+            return
+
+        entity_ids = config.lights
+        cluster_id = data.get("cluster_id")
+        command = data.get("command")
+        key = config.device_id
+
+        if cluster_id == ONOFF_CLUSTER_ID and command == "on":
+            await self._ramp.async_stop(key, settle=False)
+            await self._async_light("turn_on", entity_ids, brightness_pct=100)
+        elif cluster_id == ONOFF_CLUSTER_ID and command == "off":
+            await self._ramp.async_stop(key, settle=False)
+            await self._async_light("turn_off", entity_ids)
+        elif cluster_id == LEVEL_CLUSTER_ID and command in MOVE_COMMANDS:
+            params = data.get("params") or {}
+            await self._ramp.async_start(
+                key,
+                entity_ids,
+                up=params.get("move_mode", 0) == 0,
+                rate=config.rate,
+            )
+        elif cluster_id == LEVEL_CLUSTER_ID and command in STOP_COMMANDS:
+            await self._ramp.async_stop(key)
+
+    async def _async_light(
+        self, service: str, entity_ids: list[str], **data: Any
+    ) -> None:
+        """Call a light service for a list of entities."""
+        await self._hass.services.async_call(
+            "light", service, {ATTR_ENTITY_ID: entity_ids, **data}, blocking=True
+        )
@@ -0,0 +1,176 @@
+"""Latency histograms for the remote press pipeline.
+
+A press is traced from the Zigbee frame arriving at the quirk to the light
+service call completing. Each stage records the time elapsed since the frame
+arrived into a fixed-size bucketed histogram per remote and action:
+
+- ``event``: the zha_event reached the integration's dispatcher
+- ``state``: the action started, with the remote's state loaded
+- ``dispatch``: the first light service call was issued
+- ``complete``: that service call returned
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from contextvars import ContextVar
+import time
+from typing import Any
+
+STAGES = ("event", "state", "dispatch", "complete")
+
+# Upper bucket bounds in ms; the last bucket catches everything slower
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# Presses per remote remembered for the presses/min rate
+PRESS_WINDOW = 600
+
+# Trace of the press currently handled in this task (see PressMetrics.mark)
+current_trace: ContextVar[PressTrace | None] = ContextVar(
+    "eglo_remote_zha_press_trace", default=None
+)
+
+
+class LatencyHistogram:
+    """Bucketed latency histogram of fixed size."""
+
+    __slots__ = ("counts", "total", "max_ms")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.total = 0
+        self.max_ms = 0.0
+
+    def add(self, elapsed_ms: float) -> None:
+        """Record one sample."""
+        self.counts[bisect_left(BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+        self.total += 1
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add the samples of another histogram."""
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.total += other.total
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the upper bound of the bucket holding the pct-th percentile."""
+        if not self.total:
+            return None
+        rank = pct / 100 * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                if index < len(BUCKET_BOUNDS_MS):
+                    return float(BUCKET_BOUNDS_MS[index])
+                return self.max_ms
+        return self.max_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram and its percentiles."""
+        return {
+            "count": self.total,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "max_ms": round(self.max_ms, 1),
+            "buckets": {
+                f"le_{bound}": count
+                for bound, count in zip((*BUCKET_BOUNDS_MS, "inf"), self.counts)
+            },
+        }
+
+
+class PressTrace:
+    """Timing of a single press through the pipeline."""
+
+    __slots__ = ("device_id", "action", "started", "stages")
+
+    def __init__(self, device_id: str, action: str, started: float) -> None:
+        """Start a trace at the (monotonic) time the frame arrived."""
+        self.device_id = device_id
+        self.action = action
+        self.started = started
+        self.stages: set[str] = set()
+
+
+class PressMetrics:
+    """Per-remote, per-action press latency and throughput."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        # (device_id, action) -> stage -> histogram
+        self._histograms: dict[tuple[str, str], dict[str, LatencyHistogram]] = {}
+        # device_id -> monotonic times of recent presses
+        self._presses: dict[str, deque[float]] = {}
+        self.queued = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    def start(self, device_id: str, action: str, started: float) -> PressTrace:
+        """Start tracing a press whose frame arrived at started."""
+        presses = self._presses.get(device_id)
+        if presses is None:
+            presses = self._presses[device_id] = deque(maxlen=PRESS_WINDOW)
+        presses.append(started)
+        return PressTrace(device_id, action, started)
+
+    def mark(self, stage: str, trace: PressTrace | None = None) -> None:
+        """Record the first time a press reaches a stage."""
+        if trace is None and (trace := current_trace.get()) is None:
+            return
+        if stage in trace.stages:
+            return
+        trace.stages.add(stage)
+        key = (trace.device_id, trace.action)
+        if (stages := self._histograms.get(key)) is None:
+            stages = self._histograms[key] = {
+                name: LatencyHistogram() for name in STAGES
+            }
+        stages[stage].add((time.monotonic() - trace.started) * 1000)
+
+    def presses_per_minute(self, device_id: str | None = None) -> int:
+        """Return the presses of the last minute (of one or all remotes)."""
+        since = time.monotonic() - 60
+        remotes = (
+            [self._presses.get(device_id, ())]
+            if device_id is not None
+            else self._presses.values()
+        )
+        return sum(1 for presses in remotes for at in presses if at >= since)
+
+    def totals(self) -> dict[str, LatencyHistogram]:
+        """Return the histograms of all remotes and actions combined."""
+        totals = {name: LatencyHistogram() for name in STAGES}
+        for stages in self._histograms.values():
+            for name, histogram in stages.items():
+                totals[name].merge(histogram)
+        return totals
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all histograms and counters."""
+        remotes: dict[str, dict[str, Any]] = {}
+        for (device_id, action), stages in self._histograms.items():
+            remote = remotes.setdefault(
+                device_id,
+                {
+                    "presses_per_minute": self.presses_per_minute(device_id),
+                    "actions": {},
+                },
+            )
+            remote["actions"][action] = {
+                name: histogram.as_dict() for name, histogram in stages.items()
+            }
+        return {
+            "presses_per_minute": self.presses_per_minute(),
+            "queued": self.queued,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "total": {
+                name: histogram.as_dict() for name, histogram in self.totals().items()
+            },
+            "remotes": remotes,
+        }
@@ -0,0 +1,39 @@
+"""Register the remote quirks with zigpy and time their import.
+
+Importing a quirk module registers its CustomDevice with zigpy. ZHA picks the
+quirk of each device when it builds its zigpy devices, before this
+integration's config entry is set up, so the quirks are imported when the
+package itself is imported (see __init__.py). Only the import times are
+kept here, for diagnostics.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Quirk modules registered with zigpy
+QUIRK_MODULES = ("eglo_ercu_awox", "eglo_ercu_3groups")
+
+# quirk module -> import time in ms
+IMPORT_MS: dict[str, float] = {}
+
+
+def import_quirks() -> None:
+    """Import (and so register) every quirk module, timing each import."""
+    for module in QUIRK_MODULES:
+        start = time.perf_counter()
+        try:
+            importlib.import_module(f"{__package__}.{module}")
+        except ImportError as err:
+            _LOGGER.error(
+                "Failed to import Eglo Remote ZHA quirk %s. This usually means "
+                "zigpy is not installed or ZHA is not enabled. Error: %s",
+                module,
+                err,
+            )
+            raise
+        IMPORT_MS[module] = (time.perf_counter() - start) * 1000
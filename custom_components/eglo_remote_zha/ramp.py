@@ -0,0 +1,178 @@
+"""Hold-to-dim ramp engine.
+
+A long press starts a ramp: lights that support transitions get a single
+``brightness`` + ``transition`` command towards full/minimum brightness, and
+on release they get a single command that pins them at the level they have
+reached. Lights without transition support fall back to a rate-limited
+stepper that issues one ``brightness_step_pct`` call per interval until the
+release arrives (or the ramp would have finished anyway).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import Any
+
+from homeassistant.components.light import ATTR_BRIGHTNESS, LightEntityFeature
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_SUPPORTED_FEATURES, STATE_ON
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+MIN_BRIGHTNESS = 1
+MAX_BRIGHTNESS = 255
+
+# Brightness units per second when the remote does not send a rate
+DEFAULT_RATE = 100
+
+# Fallback stepper: at most one call per interval
+STEPPER_INTERVAL = timedelta(milliseconds=500)
+
+
+@dataclass
+class _LightRamp:
+    """Ramp of one transition-capable light."""
+
+    entity_id: str
+    start: int
+    target: int
+    duration: float
+
+    def level_at(self, elapsed: float) -> int:
+        """Return the estimated brightness after elapsed seconds."""
+        if self.duration <= 0:
+            return self.target
+        progress = min(1.0, elapsed / self.duration)
+        return round(self.start + (self.target - self.start) * progress)
+
+
+@dataclass
+class _Ramp:
+    """A running ramp for one set of lights."""
+
+    started: float
+    transition: list[_LightRamp] = field(default_factory=list)
+    stepped: list[str] = field(default_factory=list)
+    unsub_stepper: CALLBACK_TYPE | None = None
+    steps_left: int = 0
+
+
+class RampEngine:
+    """Run hold-to-dim ramps, keyed by an arbitrary ramp key."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the engine."""
+        self._hass = hass
+        self._ramps: dict[Any, _Ramp] = {}
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel all fallback steppers."""
+        for ramp in self._ramps.values():
+            if ramp.unsub_stepper is not None:
+                ramp.unsub_stepper()
+        self._ramps.clear()
+
+    async def async_start(
+        self,
+        key: Any,
+        entity_ids: list[str],
+        up: bool,
+        rate: float | None = None,
+    ) -> None:
+        """Start ramping lights up or down at rate (brightness units/s)."""
+        await self.async_stop(key, settle=False)
+        if not entity_ids:
+            return
+
+        rate = rate or DEFAULT_RATE
+        target = MAX_BRIGHTNESS if up else MIN_BRIGHTNESS
+        ramp = _Ramp(started=time.monotonic())
+
+        for entity_id in entity_ids:
+            state = self._hass.states.get(entity_id)
+            if state is None:
+                continue
+            features = state.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
+            if not features & LightEntityFeature.TRANSITION:
+                ramp.stepped.append(entity_id)
+                continue
+            start = MIN_BRIGHTNESS
+            if state.state == STATE_ON:
+                start = state.attributes.get(ATTR_BRIGHTNESS) or MIN_BRIGHTNESS
+            ramp.transition.append(
+                _LightRamp(entity_id, start, target, abs(target - start) / rate)
+            )
+
+        self._ramps[key] = ramp
+
+        # One brightness + transition command per distinct duration
+        buckets: dict[float, list[str]] = {}
+        for light in ramp.transition:
+            buckets.setdefault(round(light.duration, 1), []).append(light.entity_id)
+        for duration, bucket in buckets.items():
+            await self._async_turn_on(
+                bucket, **{ATTR_BRIGHTNESS: target, "transition": duration}
+            )
+            # A release (or a new press) while waiting ends this ramp
+            if self._ramps.get(key) is not ramp:
+                return
+
+        if ramp.stepped:
+            interval = STEPPER_INTERVAL.total_seconds()
+            step_pct = max(1, round(rate * interval / MAX_BRIGHTNESS * 100))
+            ramp.steps_left = -(-100 // step_pct)
+
+            async def _async_step(_now: datetime) -> None:
+                ramp.steps_left -= 1
+                if ramp.steps_left <= 0 and ramp.unsub_stepper is not None:
+                    ramp.unsub_stepper()
+                    ramp.unsub_stepper = None
+                await self._async_turn_on(
+                    ramp.stepped, brightness_step_pct=step_pct if up else -step_pct
+                )
+
+            await _async_step(dt_util.utcnow())
+            if self._ramps.get(key) is not ramp:
+                return
+            if ramp.steps_left > 0:
+                ramp.unsub_stepper = async_track_time_interval(
+                    self._hass,
+                    _async_step,
+                    STEPPER_INTERVAL,
+                    name="eglo_remote_zha ramp stepper",
+                    cancel_on_shutdown=True,
+                )
+
+    async def async_stop(self, key: Any, settle: bool = True) -> None:
+        """Stop a ramp, pinning transitioning lights at their current level."""
+        ramp = self._ramps.pop(key, None)
+        if ramp is None:
+            return
+        if ramp.unsub_stepper is not None:
+            ramp.unsub_stepper()
+            ramp.unsub_stepper = None
+        if not settle:
+            return
+
+        elapsed = time.monotonic() - ramp.started
+        buckets: dict[int, list[str]] = {}
+        for light in ramp.transition:
+            if elapsed >= light.duration:
+                continue  # already at its target, nothing to stop
+            buckets.setdefault(light.level_at(elapsed), []).append(light.entity_id)
+        for level, bucket in buckets.items():
+            await self._async_turn_on(
+                bucket, **{ATTR_BRIGHTNESS: level, "transition": 0}
+            )
+
+    async def _async_turn_on(self, entity_ids: list[str], **data: Any) -> None:
+        """Call light.turn_on for a list of entities."""
+        await self._hass.services.async_call(
+            "light", "turn_on", {ATTR_ENTITY_ID: entity_ids, **data}, blocking=True
+        )
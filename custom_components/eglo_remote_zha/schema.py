@@ -0,0 +1,159 @@
+"""Typed per-remote state record and its compact serialization.
+
+Known state keys are validated and normalized when they are set, so the
+state store only ever holds typed values (an area_id rather than an area
+name, an epoch timestamp rather than an ISO string) and readers never have
+to parse them again. On disk the record uses short keys and leaves out empty
+values. Keys that are not part of the record are stored as they are.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+from typing import Any, TypedDict
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, split_entity_id, valid_entity_id
+from homeassistant.helpers import area_registry as ar
+from homeassistant.util import dt as dt_util
+
+from .const import ALL_LIGHTS, BANK_GROUP_IDS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RemoteState(TypedDict, total=False):
+    """Typed state of one remote."""
+
+    current_area: str | None  # area_id; None selects the remote's own area
+    current_light: str  # light entity_id, or "all"
+    last_activity: float  # epoch seconds (UTC)
+    bank: int  # active AwoX bank, 1-3
+    mode: str
+
+
+def _area_id(hass: HomeAssistant, value: Any) -> str | None:
+    """Return an area_id, resolving area names."""
+    if value in (None, "", ALL_LIGHTS):
+        return None
+    area_reg = ar.async_get(hass)
+    value = str(value)
+    if area_reg.async_get_area(value) is not None:
+        return value
+    if (area := area_reg.async_get_area_by_name(value)) is not None:
+        return area.id
+    raise vol.Invalid(f"unknown area: {value}")
+
+
+def _light(hass: HomeAssistant, value: Any) -> str:
+    """Return a light entity_id, or "all"."""
+    if value in (None, "", ALL_LIGHTS):
+        return ALL_LIGHTS
+    value = str(value).lower()
+    if not valid_entity_id(value) or split_entity_id(value)[0] != "light":
+        raise vol.Invalid(f"not a light entity_id: {value}")
+    return value
+
+
+def _timestamp(hass: HomeAssistant, value: Any) -> float | None:
+    """Return epoch seconds from a number, datetime or ISO string."""
+    if value in (None, ""):
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if not isinstance(value, datetime):
+        parsed = dt_util.parse_datetime(str(value))
+        if parsed is None:
+            raise vol.Invalid(f"not a timestamp: {value}")
+        value = parsed
+    return dt_util.as_utc(value).timestamp()
+
+
+def _bank(hass: HomeAssistant, value: Any) -> int | None:
+    """Return an AwoX bank number."""
+    if value in (None, ""):
+        return None
+    try:
+        bank = int(value)
+    except (TypeError, ValueError) as err:
+        raise vol.Invalid(f"not a bank: {value}") from err
+    if bank not in BANK_GROUP_IDS:
+        raise vol.Invalid(f"bank must be one of {tuple(BANK_GROUP_IDS)}: {value}")
+    return bank
+
+
+def _mode(hass: HomeAssistant, value: Any) -> str | None:
+    """Return a mode name."""
+    return str(value) if value not in (None, "") else None
+
+
+@dataclass(frozen=True, slots=True)
+class StateField:
+    """A typed field of the remote state record."""
+
+    key: str
+    compact: str
+    validate: Callable[[HomeAssistant, Any], Any]
+
+
+FIELDS = {
+    field.key: field
+    for field in (
+        StateField("current_area", "a", _area_id),
+        StateField("current_light", "l", _light),
+        StateField("last_activity", "t", _timestamp),
+        StateField("bank", "b", _bank),
+        StateField("mode", "m", _mode),
+    )
+}
+_BY_COMPACT = {field.compact: field for field in FIELDS.values()}
+# Prefix for keys outside the record, so they never clash with compact keys
+_EXTRA_PREFIX = "_"
+
+
+def validate_value(hass: HomeAssistant, key: str, value: Any) -> Any:
+    """Return the typed value of a state key; raises vol.Invalid."""
+    if (state_field := FIELDS.get(key)) is None:
+        return value
+    return state_field.validate(hass, value)
+
+
+def validate_state(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+    """Return typed state, dropping (and logging) values that do not validate."""
+    state: dict[str, Any] = {}
+    for key, value in data.items():
+        try:
+            state[key] = validate_value(hass, key, value)
+        except vol.Invalid as err:
+            _LOGGER.warning("Dropping invalid state %s=%r: %s", key, value, err)
+    return state
+
+
+def to_compact(state: dict[str, Any]) -> dict[str, Any]:
+    """Serialize typed state with short keys, leaving out empty values."""
+    compact: dict[str, Any] = {}
+    for key, value in state.items():
+        if (state_field := FIELDS.get(key)) is None:
+            compact[f"{_EXTRA_PREFIX}{key}"] = value
+        elif value is not None and not (
+            key == "current_light" and value == ALL_LIGHTS
+        ):
+            compact[state_field.compact] = (
+                round(value, 3) if isinstance(value, float) else value
+            )
+    return compact
+
+
+def from_compact(compact: dict[str, Any]) -> dict[str, Any]:
+    """Deserialize state written by to_compact."""
+    state: dict[str, Any] = {}
+    for key, value in compact.items():
+        if key.startswith(_EXTRA_PREFIX):
+            state[key[len(_EXTRA_PREFIX) :]] = value
+        elif (state_field := _BY_COMPACT.get(key)) is not None:
+            state[state_field.key] = value
+    return state
@@ -0,0 +1,102 @@
+"""Press pipeline sensors for Eglo Remote ZHA (disabled by default)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .metrics import PressMetrics
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+@dataclass(frozen=True, kw_only=True)
+class PressSensorEntityDescription(SensorEntityDescription):
+    """Describes a press pipeline sensor."""
+
+    value_fn: Callable[[PressMetrics], float | int | None]
+
+
+SENSORS = (
+    PressSensorEntityDescription(
+        key="press_latency_p50",
+        name="Press latency p50",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.totals()["complete"].percentile(50),
+    ),
+    PressSensorEntityDescription(
+        key="press_latency_p95",
+        name="Press latency p95",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.totals()["complete"].percentile(95),
+    ),
+    PressSensorEntityDescription(
+        key="presses_per_minute",
+        name="Presses per minute",
+        native_unit_of_measurement="presses/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.presses_per_minute(),
+    ),
+    PressSensorEntityDescription(
+        key="queued_presses",
+        name="Queued presses",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.queued,
+    ),
+    PressSensorEntityDescription(
+        key="dropped_presses",
+        name="Dropped presses",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.dropped,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the press pipeline sensors."""
+    metrics: PressMetrics = hass.data[DOMAIN]["press_metrics"]
+    async_add_entities(
+        PressSensor(entry, metrics, description) for description in SENSORS
+    )
+
+
+class PressSensor(SensorEntity):
+    """Sensor reading one press pipeline figure."""
+
+    entity_description: PressSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        metrics: PressMetrics,
+        description: PressSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._metrics = metrics
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_name = f"Eglo Remote {description.name}"
+
+    async def async_update(self) -> None:
+        """Read the current figure in the event loop, where the metrics live."""
+        self._attr_native_value = self.entity_description.value_fn(self._metrics)
@@ -0,0 +1,308 @@
+"""Write-behind persistence for Eglo Remote ZHA remote state.
+
+State is sharded per remote: every remote has its own storage file, loaded
+on first access and saved on its own debounce timer, so a press on one remote
+never serializes the state of the others and startup never parses the state
+of remotes that are not used. State mutations are applied to an in-memory
+dict immediately and written to disk in a single debounced save, so a burst
+of set_state calls from one button press results in one write. Pending
+changes are flushed on unload and on Home Assistant shutdown.
+
+Every key has a tier: volatile keys live in memory only and never cause a
+write, durable keys are saved debounced, and immediate keys are saved right
+away. Tiers are declared per key (see DEFAULT_KEY_TIERS for the defaults).
+
+Values of the typed state record are validated when they are set (see
+schema.py) and stored on disk in its compact form.
+
+The single-file layout of storage version 1 is split into shards once, the
+first time the integration starts with this version.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from functools import partial
+import logging
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DEFAULT_KEY_TIERS,
+    LEGACY_STORAGE_VERSION,
+    SAVE_DELAY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    TIER_DURABLE,
+    TIER_IMMEDIATE,
+    TIER_VOLATILE,
+)
+from .schema import (
+    RemoteState,
+    from_compact,
+    to_compact,
+    validate_state,
+    validate_value,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _RemoteStore(Store[dict[str, Any]]):
+    """Storage file of a single remote."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict
+    ) -> dict[str, Any]:
+        """Convert untyped version 2 state into the compact typed record."""
+        return to_compact(validate_state(self.hass, old_data))
+
+
+@dataclass
+class _Shard:
+    """State of a single remote and its storage file."""
+
+    store: _RemoteStore
+    data: dict[str, Any] = field(default_factory=dict)
+    loaded: bool = False
+    dirty: bool = False
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    unsub_flush: CALLBACK_TYPE | None = None
+
+
+class RemoteStateStore:
+    """Debounced, write-behind store for per-remote state."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        save_delay: float = SAVE_DELAY,
+    ) -> None:
+        """Initialize the state store."""
+        self._hass = hass
+        self._save_delay = save_delay
+        self._shards: dict[str, _Shard] = {}
+        # device_id -> state of the remotes accessed so far
+        self._data: dict[str, dict[str, Any]] = {}
+        self._unsub_final_write: CALLBACK_TYPE | None = None
+        # key -> declared tier (undeclared keys are durable)
+        self._tiers: dict[str, str] = dict(DEFAULT_KEY_TIERS)
+
+        # Metrics
+        self._mutations = 0
+        self._volatile_mutations = 0
+        self._flushes = 0
+        self._last_flush_ms: float | None = None
+        self._max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    @property
+    def data(self) -> dict[str, dict[str, Any]]:
+        """Return the live state of the remotes accessed so far, by device_id."""
+        return self._data
+
+    async def async_load(self) -> None:
+        """Migrate the legacy layout and register the shutdown flush.
+
+        Remote state itself is loaded on first access.
+        """
+        await self._async_migrate_legacy()
+        self._unsub_final_write = self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_handle_final_write
+        )
+
+    async def async_load_remote(self, device_id: str) -> RemoteState:
+        """Load the state of a remote (once) and return it."""
+        shard = self._shard(device_id)
+        if shard.loaded:
+            return shard.data
+        async with shard.lock:
+            if not shard.loaded:
+                stored = from_compact(await shard.store.async_load() or {})
+                # Values set before the load finished win over stored ones
+                for key, value in stored.items():
+                    shard.data.setdefault(key, value)
+                shard.loaded = True
+        return shard.data
+
+    @callback
+    def tier(self, key: str) -> str:
+        """Return the tier of a key."""
+        return self._tiers.get(key, TIER_DURABLE)
+
+    @callback
+    def async_set_tier(self, key: str, tier: str) -> None:
+        """Declare the tier of a key for all remotes."""
+        self._tiers[key] = tier
+
+    @callback
+    def get(self, device_id: str, key: str, default: Any = None) -> Any:
+        """Return a single state value of a loaded remote."""
+        return self._data.get(device_id, {}).get(key, default)
+
+    @callback
+    def async_set(self, device_id: str, key: str, value: Any) -> None:
+        """Set a state value and save it according to the key's tier."""
+        self.async_update(device_id, {key: value})
+
+    @callback
+    def async_update(self, device_id: str, values: dict[str, Any]) -> None:
+        """Set several state values at once with at most one save.
+
+        Raises vol.Invalid (and changes nothing) if a value does not validate.
+        """
+        values = {
+            key: validate_value(self._hass, key, value)
+            for key, value in values.items()
+        }
+        shard = self._shard(device_id)
+        changed: set[str] = set()
+        for key, value in values.items():
+            if key in shard.data and shard.data[key] == value:
+                continue
+            shard.data[key] = value
+            changed.add(self.tier(key))
+
+        if not changed:
+            return
+        if changed == {TIER_VOLATILE}:
+            self._volatile_mutations += 1
+            return
+        self._mutations += 1
+        if TIER_IMMEDIATE in changed:
+            shard.dirty = True
+            self._hass.async_create_task(
+                self._async_flush_shard(device_id, shard),
+                f"eglo_remote_zha flush {device_id}",
+            )
+        else:
+            self._async_schedule_flush(device_id, shard)
+
+    @callback
+    def _shard(self, device_id: str) -> _Shard:
+        """Return the shard of a remote, creating it (unloaded) if needed."""
+        if (shard := self._shards.get(device_id)) is None:
+            shard = self._shards[device_id] = _Shard(
+                store=_RemoteStore(
+                    self._hass, STORAGE_VERSION, f"{STORAGE_KEY}.{device_id}"
+                )
+            )
+            self._data[device_id] = shard.data
+        return shard
+
+    @callback
+    def _async_schedule_flush(self, device_id: str, shard: _Shard) -> None:
+        """Schedule a flush of a shard unless one is already pending."""
+        shard.dirty = True
+        if shard.unsub_flush is None:
+            shard.unsub_flush = async_call_later(
+                self._hass,
+                self._save_delay,
+                partial(self._async_scheduled_flush, device_id, shard),
+            )
+
+    async def _async_scheduled_flush(
+        self, device_id: str, shard: _Shard, _now: Any
+    ) -> None:
+        """Flush pending changes of a remote when its debounce timer fires."""
+        shard.unsub_flush = None
+        await self._async_flush_shard(device_id, shard)
+
+    async def _async_handle_final_write(self, _event: Event) -> None:
+        """Flush pending changes before Home Assistant stops."""
+        self._unsub_final_write = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write pending changes of all remotes to disk now."""
+        await asyncio.gather(
+            *(
+                self._async_flush_shard(device_id, shard)
+                for device_id, shard in list(self._shards.items())
+                if shard.dirty
+            )
+        )
+
+    async def _async_flush_shard(self, device_id: str, shard: _Shard) -> None:
+        """Write pending changes of one remote to disk now."""
+        if shard.unsub_flush is not None:
+            shard.unsub_flush()
+            shard.unsub_flush = None
+
+        if not shard.dirty:
+            return
+        # Never overwrite stored values that were not loaded yet
+        await self.async_load_remote(device_id)
+        shard.dirty = False
+
+        # Snapshot so the executor-side JSON dump never sees a dict that the
+        # event loop is still mutating. Volatile keys never reach the disk.
+        snapshot = to_compact(
+            {
+                key: value
+                for key, value in shard.data.items()
+                if self.tier(key) != TIER_VOLATILE
+            }
+        )
+
+        start = time.perf_counter()
+        await shard.store.async_save(snapshot)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        self._flushes += 1
+        self._last_flush_ms = elapsed_ms
+        self._total_flush_ms += elapsed_ms
+        self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+
+        _LOGGER.debug(
+            "Flushed state of %s in %.1f ms (%d mutations, %d flushes)",
+            device_id,
+            elapsed_ms,
+            self._mutations,
+            self._flushes,
+        )
+
+    async def async_shutdown(self) -> None:
+        """Flush pending changes and stop listening for shutdown."""
+        if self._unsub_final_write is not None:
+            self._unsub_final_write()
+            self._unsub_final_write = None
+        await self.async_flush()
+
+    async def _async_migrate_legacy(self) -> None:
+        """Split the single version 1 state file into per-remote shards."""
+        legacy: Store[dict[str, dict[str, Any]]] = Store(
+            self._hass, LEGACY_STORAGE_VERSION, STORAGE_KEY
+        )
+        if (data := await legacy.async_load()) is None:
+            return
+
+        for device_id, device_state in data.items():
+            shard = self._shard(device_id)
+            shard.data.update(validate_state(self._hass, device_state))
+            shard.loaded = True
+            await shard.store.async_save(to_compact(shard.data))
+        await legacy.async_remove()
+        _LOGGER.info("Migrated state of %d remote(s) to per-remote storage", len(data))
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return flush counters and latency."""
+        return {
+            "mutations": self._mutations,
+            "volatile_mutations": self._volatile_mutations,
+            "flushes": self._flushes,
+            "pending": sum(shard.dirty for shard in self._shards.values()),
+            "loaded_remotes": sum(shard.loaded for shard in self._shards.values()),
+            "last_flush_ms": self._last_flush_ms,
+            "max_flush_ms": self._max_flush_ms,
+            "avg_flush_ms": (
+                self._total_flush_ms / self._flushes if self._flushes else None
+            ),
+        }
@@ -8,8 +8,19 @@ This quirk exposes 66 separate device automation triggers:
 - 22 unique actions (short/long press on 13 control buttons)
 - × 3 banks
 - = 66 total triggers with group suffix (_1, _2, _3)
+
+The bank is resolved once in the custom clusters, which emit a zha_event whose
+command is the bank-suffixed action name, with ``_long`` for long presses
+(e.g. ``red_2`` and ``red_long_2``), so each press matches exactly one
+trigger. Retransmitted frames (same transaction sequence
+number) are dropped before they become events (see DedupMixin).
 """
 
+from collections import deque
+import logging
+import time
+from typing import Any
+
 from zigpy.profiles import zha
 from zigpy.quirks import CustomCluster, CustomDevice
 import zigpy.types as t
@@ -47,6 +58,7 @@ from zhaquirks.const import (
     SHORT_PRESS,
     TURN_OFF,
     TURN_ON,
+    ZHA_SEND_EVENT,
 )
 
 # Command definitions
@@ -68,95 +80,227 @@ GROUP_TO_BANK = {
     GROUP_ID_2: 2,
     GROUP_ID_3: 3,
 }
+DEFAULT_BANK = 1
+BANKS = (1, 2, 3)
 
+_LOGGER = logging.getLogger(__name__)
 
-class Awox99099Remote3Banks(CustomDevice):
-    """Custom device representing AwoX 99099 remote with 3-bank support"""
+# Optional ring buffer of recently received frames, see enable_frame_trace();
+# the integration's frame_trace service and its diagnostics use these
+_frame_trace: deque | None = None
 
-    class AwoxOnOffCluster(CustomCluster, OnOff):
-        """Custom OnOff Cluster with group tracking"""
 
-        def handle_cluster_request(
-            self,
-            hdr: foundation.ZCLHeader,
-            args: list,
-            *,
-            dst_addressing=None,
-        ):
-            """Handle cluster request and extract group ID."""
-            import logging
-            _LOGGER = logging.getLogger(__name__)
-            
-            # Debug: Log everything we can see
-            _LOGGER.warning(
-                "AwoxOnOffCluster: cmd_id=%s, dst_addressing=%s, "
-                "has_group=%s, group=%s",
-                hdr.command_id,
-                dst_addressing,
-                hasattr(dst_addressing, 'group') if dst_addressing else False,
-                getattr(dst_addressing, 'group', None) if dst_addressing else None
-            )
-            
-            # Extract group ID from destination addressing
-            group_id = None
-            if dst_addressing and hasattr(dst_addressing, 'group'):
-                group_id = dst_addressing.group
-                _LOGGER.warning("AwoxOnOffCluster: Extracted group_id=%s", group_id)
-                
-            # Map group ID to bank number
-            bank = GROUP_TO_BANK.get(group_id, 1) if group_id else 1
-            _LOGGER.warning("AwoxOnOffCluster: Mapped to bank=%s", bank)
-            
-            # Store bank for potential use
-            self._current_bank = bank
-            
-            return super().handle_cluster_request(
-                hdr, args, dst_addressing=dst_addressing
-            )
+def enable_frame_trace(size: int = 64) -> None:
+    """Start recording the last `size` received frames for diagnostics."""
+    global _frame_trace
+    _frame_trace = deque(maxlen=size)
 
-    class AwoxScenesCluster(CustomCluster, Scenes):
-        """Custom Scenes Cluster with group tracking"""
 
-        def handle_cluster_request(
-            self,
-            hdr: foundation.ZCLHeader,
-            args: list,
-            *,
-            dst_addressing=None,
-        ):
-            """Handle cluster request and extract group ID."""
-            import logging
-            _LOGGER = logging.getLogger(__name__)
-            
-            # Debug: Log everything we can see
-            _LOGGER.warning(
-                "AwoxScenesCluster: cmd_id=%s, dst_addressing=%s, "
-                "has_group=%s, group=%s, args=%s",
+def disable_frame_trace() -> None:
+    """Stop recording received frames."""
+    global _frame_trace
+    _frame_trace = None
+
+
+def dump_frame_trace() -> list[dict[str, Any]]:
+    """Return the recorded frames, oldest first."""
+    if _frame_trace is None:
+        return []
+    return [
+        {
+            "timestamp": timestamp,
+            "ieee": str(ieee),
+            "cluster_id": cluster_id,
+            "tsn": tsn,
+            "command_id": command_id,
+            "group_id": group_id,
+            "bank": bank,
+        }
+        for timestamp, ieee, cluster_id, tsn, command_id, group_id, bank in _frame_trace
+    ]
+
+
+def _group_id(dst_addressing) -> int | None:
+    """Return the group a frame was sent to, if it was a group-cast."""
+    if dst_addressing is None:
+        return None
+    if getattr(dst_addressing, "addr_mode", None) == t.AddrMode.Group:
+        return dst_addressing.address
+    return getattr(dst_addressing, "group", None)
+
+
+# DUPLICATES_SUPPRESSED, _FrameRing and DedupMixin are copies of those in
+# custom_components/eglo_remote_zha/eglo_ercu_awox.py: this quirk is installed
+# as a standalone file and cannot import from the integration. Keep the two
+# copies in sync.
+
+# ieee -> duplicate frames dropped by DedupMixin, for diagnostics
+DUPLICATES_SUPPRESSED: dict[str, int] = {}
+
+
+class _FrameRing:
+    """Fixed-size ring of the frames a device handled recently."""
+
+    __slots__ = ("keys", "times", "index", "suppressed")
+
+    def __init__(self, size: int) -> None:
+        self.keys: list[tuple | None] = [None] * size
+        self.times = [0.0] * size
+        self.index = 0
+        self.suppressed = 0
+
+    def seen(self, key: tuple, now: float, window: float) -> bool:
+        """Return True for a repeat of a recent frame, else remember it."""
+        for slot, slot_key in enumerate(self.keys):
+            if slot_key == key and now - self.times[slot] <= window:
+                self.suppressed += 1
+                return True
+        self.keys[self.index] = key
+        self.times[self.index] = now
+        self.index = (self.index + 1) % len(self.keys)
+        return False
+
+
+class DedupMixin:
+    """Drop retransmitted and repeated frames of a single press.
+
+    The remote retransmits frames and may deliver a press both as a
+    group-cast and as a repeated frame, all with the same ZCL transaction
+    sequence number. A frame whose (cluster, TSN, command) was handled by
+    the same device within ``dedup_window`` seconds is dropped before it
+    turns into an event. Held buttons repeat with new TSNs and are not
+    affected. The ring is shared by the device's clusters and never grows.
+    """
+
+    dedup_window = 1.0
+    dedup_ring_size = 8
+
+    def handle_message(self, hdr: foundation.ZCLHeader, args, *rest, **kwargs):
+        """Handle a frame unless it repeats one handled moments ago."""
+        if hdr.frame_control.is_cluster:
+            device = self.endpoint.device
+            ring = getattr(device, "_frame_ring", None)
+            if ring is None:
+                ring = device._frame_ring = _FrameRing(self.dedup_ring_size)
+            key = (self.cluster_id, hdr.tsn, hdr.command_id)
+            if ring.seen(key, time.monotonic(), self.dedup_window):
+                DUPLICATES_SUPPRESSED[str(device.ieee)] = ring.suppressed
+                return None
+        return super().handle_message(hdr, args, *rest, **kwargs)
+
+
+class AwoxBankMixin:
+    """Resolve the active bank from the Touchlink group of a received frame."""
+
+    _current_bank: int = DEFAULT_BANK
+
+    def handle_cluster_request(
+        self,
+        hdr: foundation.ZCLHeader,
+        args: list,
+        *,
+        dst_addressing=None,
+    ):
+        """Handle cluster request and extract the bank from the group ID."""
+        group_id = _group_id(dst_addressing)
+        if group_id is None:
+            # zigpy no longer passes dst_addressing, the device records it
+            group_id = getattr(self.endpoint.device, "last_group_id", None)
+        bank = GROUP_TO_BANK.get(group_id, DEFAULT_BANK)
+        self._current_bank = bank
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: cmd_id=%s, group=%s, bank=%s, args=%s",
+                type(self).__name__,
                 hdr.command_id,
-                dst_addressing,
-                hasattr(dst_addressing, 'group') if dst_addressing else False,
-                getattr(dst_addressing, 'group', None) if dst_addressing else None,
-                args
+                group_id,
+                bank,
+                args,
             )
-            
-            # Extract group ID from destination addressing
-            group_id = None
-            if dst_addressing and hasattr(dst_addressing, 'group'):
-                group_id = dst_addressing.group
-                _LOGGER.warning("AwoxScenesCluster: Extracted group_id=%s", group_id)
-                
-            # Map group ID to bank number
-            bank = GROUP_TO_BANK.get(group_id, 1) if group_id else 1
-            _LOGGER.warning("AwoxScenesCluster: Mapped to bank=%s", bank)
-            
-            # Store bank for potential use
-            self._current_bank = bank
-            
-            return super().handle_cluster_request(
-                hdr, args, dst_addressing=dst_addressing
+        self._emit_bank_event(hdr, args, group_id, bank)
+
+        if _frame_trace is not None:
+            _frame_trace.append(
+                (
+                    time.monotonic(),
+                    self.endpoint.device.ieee,
+                    self.cluster_id,
+                    hdr.tsn,
+                    hdr.command_id,
+                    group_id,
+                    bank,
+                )
             )
 
-    class AwoxColorCluster(CustomCluster, Color):
+        return super().handle_cluster_request(
+            hdr, args, dst_addressing=dst_addressing
+        )
+
+    def _emit_bank_event(
+        self, hdr: foundation.ZCLHeader, args, group_id: int | None, bank: int
+    ) -> None:
+        """Emit the bank-suffixed action for a recognised button press."""
+        command = self.server_commands.get(hdr.command_id)
+        if command is None:
+            return
+        key = (self.cluster_id, command.name)
+        param_names = _ACTION_PARAM_NAMES.get(key)
+        if param_names is None:
+            return
+
+        params = args.as_dict() if hasattr(args, "as_dict") else {}
+        match = _ACTIONS.get((*key, tuple(params.get(n) for n in param_names)))
+        if match is None:
+            return
+
+        press_type, action = match
+        self.listener_event(
+            ZHA_SEND_EVENT,
+            _event_command(press_type, action, bank),
+            {
+                **params,
+                "action": action,
+                "press_type": press_type,
+                "bank": bank,
+                "group_id": group_id,
+            },
+        )
+
+
+def _event_command(press_type: str, action: str, bank: int) -> str:
+    """Return the zha_event command of a press, e.g. ``red_long_2``.
+
+    ZHA only matches triggers on the command (quirk events carry no params),
+    so the press type has to be part of it.
+    """
+    if press_type == LONG_PRESS:
+        return f"{action}_long_{bank}"
+    return f"{action}_{bank}"
+
+
+class Awox99099Remote3Banks(CustomDevice):
+    """Custom device representing AwoX 99099 remote with 3-bank support"""
+
+    last_group_id: int | None = None
+
+    def packet_received(self, packet: t.ZigbeePacket) -> None:
+        """Record the Touchlink group a frame was sent to before handling it."""
+        dst = packet.dst
+        self.last_group_id = (
+            dst.address
+            if dst is not None and dst.addr_mode == t.AddrMode.Group
+            else None
+        )
+        super().packet_received(packet)
+
+    class AwoxOnOffCluster(DedupMixin, AwoxBankMixin, CustomCluster, OnOff):
+        """Custom OnOff Cluster with group tracking"""
+
+    class AwoxScenesCluster(DedupMixin, AwoxBankMixin, CustomCluster, Scenes):
+        """Custom Scenes Cluster with group tracking"""
+
+    class AwoxColorCluster(DedupMixin, AwoxBankMixin, CustomCluster, Color):
         """Awox Remote Custom Color Cluster with group tracking"""
 
         server_commands = Color.server_commands.copy()
@@ -166,39 +310,9 @@ class Awox99099Remote3Banks(CustomDevice):
             is_manufacturer_specific=True,
         )
 
-        def handle_cluster_request(
-            self,
-            hdr: foundation.ZCLHeader,
-            args: list,
-            *,
-            dst_addressing=None,
-        ):
-            """Handle cluster request and extract group ID."""
-            # Extract group ID from destination addressing
-            group_id = None
-            if dst_addressing and hasattr(dst_addressing, 'group'):
-                group_id = dst_addressing.group
-                
-            # Map group ID to bank number
-            bank = GROUP_TO_BANK.get(group_id, 1) if group_id else 1
-            
-            # Store bank for potential use
-            self._current_bank = bank
-            
-            # Get the command name
-            cmd_name = self.server_commands.get(hdr.command_id)
-            if cmd_name and hasattr(cmd_name, 'name'):
-                cmd_name = cmd_name.name
-            
-            # For manufacturer-specific commands or standard commands,
-            # the parent class will handle event emission
-            # We'll let the standard device_automation_triggers handle the mapping
-            
-            return super().handle_cluster_request(
-                hdr, args, dst_addressing=dst_addressing
-            )
-
-    class AwoxLevelControlCluster(CustomCluster, LevelControl):
+    class AwoxLevelControlCluster(
+        DedupMixin, AwoxBankMixin, CustomCluster, LevelControl
+    ):
         """Awox Remote Custom LevelControl Cluster with group tracking"""
 
         server_commands = LevelControl.server_commands.copy()
@@ -208,49 +322,6 @@ class Awox99099Remote3Banks(CustomDevice):
             is_manufacturer_specific=True,
         )
 
-        def handle_cluster_request(
-            self,
-            hdr: foundation.ZCLHeader,
-            args: list,
-            *,
-            dst_addressing=None,
-        ):
-            """Handle cluster request and extract group ID."""
-            import logging
-            _LOGGER = logging.getLogger(__name__)
-            
-            # Debug: Log everything we can see
-            _LOGGER.warning(
-                "AwoxLevelControlCluster: cmd_id=%s, dst_addressing=%s, "
-                "has_group=%s, group=%s, args=%s",
-                hdr.command_id,
-                dst_addressing,
-                hasattr(dst_addressing, 'group') if dst_addressing else False,
-                getattr(dst_addressing, 'group', None) if dst_addressing else None,
-                args
-            )
-            
-            # Extract group ID from destination addressing
-            group_id = None
-            if dst_addressing and hasattr(dst_addressing, 'group'):
-                group_id = dst_addressing.group
-                _LOGGER.warning("AwoxLevelControlCluster: Extracted group_id=%s", group_id)
-                
-            # Map group ID to bank number
-            bank = GROUP_TO_BANK.get(group_id, 1) if group_id else 1
-            _LOGGER.warning("AwoxLevelControlCluster: Mapped to bank=%s", bank)
-            
-            # Store bank for potential use
-            self._current_bank = bank
-            
-            # For manufacturer-specific commands or standard commands,
-            # the parent class will handle event emission
-            # We'll let the standard device_automation_triggers handle the mapping
-            
-            return super().handle_cluster_request(
-                hdr, args, dst_addressing=dst_addressing
-            )
-
     signature = {
         # <SimpleDescriptor endpoint=1 profile=260 device_type=2048
         # device_version=1
@@ -452,18 +523,40 @@ class Awox99099Remote3Banks(CustomDevice):
     }
 
     # Generate device_automation_triggers with group suffixes
-    # 22 base actions × 3 banks = 66 total triggers
-    device_automation_triggers = {}
-    
-    for (press_type, action), trigger_def in _base_triggers.items():
-        for bank in [1, 2, 3]:
-            # Create action name with bank suffix
-            action_with_bank = f"{action}_{bank}"
-            
-            # Create trigger definition with bank number
-            trigger_with_bank = trigger_def.copy()
-            trigger_with_bank[ENDPOINT_ID] = 1
-            trigger_with_bank["bank"] = bank  # Add bank metadata
-            
-            # Add to device automation triggers
-            device_automation_triggers[(press_type, action_with_bank)] = trigger_with_bank
+    # 22 base actions × 3 banks = 66 total triggers, each matching exactly one
+    # event command emitted by AwoxBankMixin
+    device_automation_triggers = {
+        (press_type, f"{action}_{bank}"): {
+            COMMAND: _event_command(press_type, action, bank),
+            CLUSTER_ID: trigger_def[CLUSTER_ID],
+            ENDPOINT_ID: 1,
+        }
+        for (press_type, action), trigger_def in _base_triggers.items()
+        for bank in BANKS
+    }
+
+
+def _build_action_tables(
+    base_triggers: dict,
+) -> tuple[dict[tuple[int, str], tuple[str, ...]], dict[tuple, tuple[str, str]]]:
+    """Build (cluster_id, command, params) -> (press_type, action) lookups."""
+    param_names: dict[tuple[int, str], set[str]] = {}
+    for trigger in base_triggers.values():
+        key = (trigger[CLUSTER_ID], trigger[COMMAND])
+        param_names.setdefault(key, set()).update(trigger.get(PARAMS, {}))
+    names = {key: tuple(sorted(value)) for key, value in param_names.items()}
+
+    actions = {}
+    for (press_type, action), trigger in base_triggers.items():
+        key = (trigger[CLUSTER_ID], trigger[COMMAND])
+        params = trigger.get(PARAMS, {})
+        actions[(*key, tuple(params.get(n) for n in names[key]))] = (
+            press_type,
+            action,
+        )
+    return names, actions
+
+
+_ACTION_PARAM_NAMES, _ACTIONS = _build_action_tables(
+    Awox99099Remote3Banks._base_triggers
+)
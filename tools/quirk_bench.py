@@ -0,0 +1,387 @@
+"""Replay recorded Zigbee frames through the Eglo quirks and benchmark them.
+
+Each quirk is instantiated as a real zigpy CustomDevice on top of a stubbed
+controller application, and recorded ZCL frames are fed through
+``Device.packet_received`` exactly as a radio library would. For every frame
+the harness records the handling latency, the peak memory allocated while
+handling it (with ``--trace-alloc``) and the events the clusters emitted
+(``cluster_command`` for the standard zha_event, ``zha_send_event`` for
+events emitted by the quirk itself), plus the retransmitted frames each
+quirk's DedupMixin dropped (frames with a recorded ``tsn`` keep it on every
+repeat). Every event command a quirk emitted
+itself is checked against its device automation triggers and reported
+unless it matches exactly one of them. If the frame file lists ``expect``ed
+event counts per quirk, a single replay at the recorded pace is checked
+against them and the harness exits non-zero on a difference.
+
+Usage:
+    python tools/quirk_bench.py tools/frames/remote_session.json
+    python tools/quirk_bench.py tools/frames/remote_session.json --rate 50 --loops 20
+    python tools/quirk_bench.py FRAMES.json --quirk awox_3banks --trace-alloc -v
+
+Requires zigpy and zha-quirks (the same versions ZHA uses).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter, defaultdict
+import importlib.util
+import json
+from pathlib import Path
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any
+from unittest import mock
+
+import zigpy.device
+import zigpy.types as t
+from zigpy.zcl import foundation
+
+from zhaquirks.const import (
+    COMMAND,
+    DEVICE_TYPE,
+    ENDPOINTS,
+    INPUT_CLUSTERS,
+    MODELS_INFO,
+    OUTPUT_CLUSTERS,
+    PARAMS,
+    PROFILE_ID,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Quirk name used in frame files -> (module path, class name)
+QUIRKS = {
+    "awox": (
+        REPO_ROOT / "custom_components/eglo_remote_zha/eglo_ercu_awox.py",
+        "Awox99099Remote",
+    ),
+    "awox_3banks": (
+        REPO_ROOT / "quirks/eglo_ercu_awox_3banks.py",
+        "Awox99099Remote3Banks",
+    ),
+    "3groups": (
+        REPO_ROOT / "custom_components/eglo_remote_zha/eglo_ercu_3groups.py",
+        "EgloERCU3Groups",
+    ),
+}
+
+COORDINATOR_NWK = 0x0000
+
+
+def load_quirk(name: str) -> type:
+    """Import a quirk module by path (without importing Home Assistant)."""
+    path, class_name = QUIRKS[name]
+    spec = importlib.util.spec_from_file_location(f"eglo_bench_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return getattr(module, class_name)
+
+
+def stub_application() -> mock.MagicMock:
+    """Return a controller application stub that accepts any request."""
+    app = mock.MagicMock()
+    app._req_listeners = defaultdict(list)
+    app.request = mock.AsyncMock(return_value=(foundation.Status.SUCCESS, ""))
+    return app
+
+
+def build_device(
+    quirk: type, app: mock.MagicMock, ieee: str, nwk: int
+) -> zigpy.device.Device:
+    """Create the device described by the quirk signature and apply the quirk."""
+    device = zigpy.device.Device(app, t.EUI64.convert(ieee), t.NWK(nwk))
+    device.manufacturer, device.model = quirk.signature[MODELS_INFO][0]
+
+    for endpoint_id, descriptor in quirk.signature[ENDPOINTS].items():
+        endpoint = device.add_endpoint(endpoint_id)
+        endpoint.profile_id = descriptor[PROFILE_ID]
+        endpoint.device_type = descriptor[DEVICE_TYPE]
+        for cluster_id in descriptor.get(INPUT_CLUSTERS, []):
+            endpoint.add_input_cluster(cluster_id)
+        for cluster_id in descriptor.get(OUTPUT_CLUSTERS, []):
+            endpoint.add_output_cluster(cluster_id)
+
+    return quirk(app, device.ieee, device.nwk, device)
+
+
+def matching_triggers(quirk: type, command: str) -> int:
+    """Return how many device automation triggers an emitted command matches.
+
+    ZHA emits quirk events without params, so triggers that require params
+    never match them.
+    """
+    return sum(
+        1
+        for trigger in getattr(quirk, "device_automation_triggers", {}).values()
+        if trigger.get(COMMAND) == command and not trigger.get(PARAMS)
+    )
+
+
+class EventRecorder:
+    """Cluster listener collecting the events a frame produced."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, Any]] = []
+
+    def cluster_command(self, tsn: int, command_id: int, args: Any) -> None:
+        self.events.append(("cluster_command", command_id))
+
+    def zha_send_event(self, command: str, args: Any) -> None:
+        self.events.append(("zha_send_event", command))
+
+    def general_command(self, hdr: foundation.ZCLHeader, args: Any) -> None:
+        self.events.append(("general_command", hdr.command_id))
+
+
+def build_packet(
+    device: zigpy.device.Device, frame: dict[str, Any], tsn: int
+) -> t.ZigbeePacket:
+    """Serialize a recorded frame into the packet a radio library would pass on."""
+    endpoint = device.endpoints[frame.get("endpoint", 1)]
+    cluster = endpoint.out_clusters[frame["cluster"]]
+
+    command = next(
+        cmd
+        for cmd in cluster.server_commands.values()
+        if cmd.name == frame["command"]
+    )
+    hdr = foundation.ZCLHeader.cluster(
+        tsn=frame.get("tsn", tsn),
+        command_id=command.id,
+        manufacturer=frame.get("manufacturer"),
+    )
+    hdr.frame_control = hdr.frame_control.replace(
+        disable_default_response=not frame.get("default_response", False)
+    )
+    payload = hdr.serialize() + command.schema(**frame.get("args", {})).serialize()
+
+    if (group := frame.get("group")) is not None:
+        dst = t.AddrModeAddress(addr_mode=t.AddrMode.Group, address=group)
+    else:
+        dst = t.AddrModeAddress(addr_mode=t.AddrMode.NWK, address=COORDINATOR_NWK)
+
+    return t.ZigbeePacket(
+        src=t.AddrModeAddress(addr_mode=t.AddrMode.NWK, address=device.nwk),
+        src_ep=endpoint.endpoint_id,
+        dst=dst,
+        dst_ep=frame.get("dst_endpoint", 1),
+        tsn=hdr.tsn,
+        profile_id=endpoint.profile_id,
+        cluster_id=cluster.cluster_id,
+        data=t.SerializableBytes(payload),
+        lqi=255,
+        rssi=-40,
+    )
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the pct-th percentile of values (nearest rank)."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def replay(
+    frames: list[dict[str, Any]],
+    *,
+    only_quirk: str | None,
+    rate: float | None,
+    loops: int,
+    trace_alloc: bool,
+    verbose: bool,
+) -> dict[str, dict[str, Any]]:
+    """Replay frames and return per-quirk statistics."""
+    app = stub_application()
+    devices: dict[str, zigpy.device.Device] = {}
+    quirks: dict[str, type] = {}
+    recorders: dict[str, EventRecorder] = {}
+
+    latencies: dict[str, list[float]] = defaultdict(list)
+    allocations: dict[str, list[int]] = defaultdict(list)
+    events: dict[str, Counter] = defaultdict(Counter)
+
+    if trace_alloc:
+        tracemalloc.start()
+
+    tsn = 0
+    for _ in range(loops):
+        for frame in frames:
+            name = frame.get("quirk", "awox")
+            if only_quirk is not None and name != only_quirk:
+                continue
+
+            if name not in devices:
+                quirks[name] = load_quirk(name)
+                device = build_device(
+                    quirks[name],
+                    app,
+                    f"00:0d:6f:00:00:00:00:{len(devices) + 1:02x}",
+                    0x1000 + len(devices),
+                )
+                recorder = EventRecorder()
+                for endpoint_id, endpoint in device.endpoints.items():
+                    if endpoint_id == 0:
+                        continue
+                    for cluster in (
+                        *endpoint.in_clusters.values(),
+                        *endpoint.out_clusters.values(),
+                    ):
+                        cluster.add_listener(recorder)
+                devices[name] = device
+                recorders[name] = recorder
+
+            device = devices[name]
+            recorder = recorders[name]
+
+            for _ in range(frame.get("repeat", 1)):
+                tsn = (tsn + 1) % 256
+                packet = build_packet(device, frame, tsn)
+                seen = len(recorder.events)
+
+                if trace_alloc:
+                    tracemalloc.reset_peak()
+                    baseline = tracemalloc.get_traced_memory()[0]
+                start = time.perf_counter_ns()
+                device.packet_received(packet)
+                elapsed_us = (time.perf_counter_ns() - start) / 1000
+                if trace_alloc:
+                    allocations[name].append(
+                        tracemalloc.get_traced_memory()[1] - baseline
+                    )
+
+                latencies[name].append(elapsed_us)
+
+                if verbose:
+                    print(
+                        f"{name:12} {frame['command']:28} {elapsed_us:8.1f} us "
+                        f"{recorder.events[seen:]}"
+                    )
+
+                delay_ms = 1000 / rate if rate else frame.get("delay_ms", 0)
+                await asyncio.sleep(delay_ms / 1000)
+
+    # Let synthesized release/double-press timers fire, then count everything
+    # the clusters emitted (including events emitted from timers)
+    await asyncio.sleep(1)
+    for name, recorder in recorders.items():
+        events[name].update(event for event, _ in recorder.events)
+        events[name].update(
+            f"{event}:{detail}"
+            for event, detail in recorder.events
+            if event == "zha_send_event"
+        )
+
+    if trace_alloc:
+        tracemalloc.stop()
+
+    return {
+        name: {
+            "frames": len(values),
+            "p50_us": percentile(values, 50),
+            "p95_us": percentile(values, 95),
+            "p99_us": percentile(values, 99),
+            "max_us": max(values),
+            "mean_us": statistics.fmean(values),
+            "peak_alloc_bytes": (
+                statistics.fmean(allocations[name]) if allocations[name] else None
+            ),
+            "events": dict(sorted(events[name].items())),
+            # retransmitted frames DedupMixin dropped, over all devices
+            "duplicates_suppressed": sum(
+                getattr(
+                    sys.modules[quirks[name].__module__], "DUPLICATES_SUPPRESSED", {}
+                ).values()
+            ),
+            # emitted command -> number of triggers it matches, if not one
+            "trigger_mismatches": {
+                command: matches
+                for command in sorted(
+                    {
+                        detail
+                        for event, detail in recorders[name].events
+                        if event == "zha_send_event"
+                    }
+                )
+                if (matches := matching_triggers(quirks[name], command)) != 1
+            },
+        }
+        for name, values in latencies.items()
+    }
+
+
+def main() -> int:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("frames", type=Path, help="JSON file with recorded frames")
+    parser.add_argument(
+        "--quirk", choices=sorted(QUIRKS), help="only replay this quirk"
+    )
+    parser.add_argument(
+        "--rate", type=float, help="frames per second (overrides recorded delays)"
+    )
+    parser.add_argument("--loops", type=int, default=1, help="replay the file N times")
+    parser.add_argument(
+        "--trace-alloc", action="store_true", help="measure allocations per frame"
+    )
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print each frame")
+    options = parser.parse_args()
+
+    recording = json.loads(options.frames.read_text())
+    frames = recording["frames"]
+    results = asyncio.run(
+        replay(
+            frames,
+            only_quirk=options.quirk,
+            rate=options.rate,
+            loops=options.loops,
+            trace_alloc=options.trace_alloc,
+            verbose=options.verbose,
+        )
+    )
+
+    # Expected counts depend on the recorded timing (press windows)
+    failures: list[str] = []
+    if options.loops == 1 and options.rate is None:
+        for name, expected in recording.get("expect", {}).items():
+            if name not in results:
+                continue
+            counts = {
+                **results[name]["events"],
+                "duplicates_suppressed": results[name]["duplicates_suppressed"],
+            }
+            for event, count in expected.items():
+                if (got := counts.get(event, 0)) != count:
+                    failures.append(f"{name}: expected {event} {count}, got {got}")
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+        return 1 if failures else 0
+
+    for name, result in results.items():
+        print(f"{name}: {result['frames']} frames")
+        print(
+            f"  latency us  p50={result['p50_us']:.1f}  p95={result['p95_us']:.1f}  "
+            f"p99={result['p99_us']:.1f}  max={result['max_us']:.1f}  "
+            f"mean={result['mean_us']:.1f}"
+        )
+        if result["peak_alloc_bytes"] is not None:
+            print(f"  peak alloc  {result['peak_alloc_bytes']:.0f} bytes/frame")
+        for event, count in result["events"].items():
+            print(f"  {event:40} {count}")
+        print(f"  {'duplicates_suppressed':40} {result['duplicates_suppressed']}")
+        for command, matches in result["trigger_mismatches"].items():
+            print(f"  ! {command} matches {matches} triggers")
+    for failure in failures:
+        print(f"! {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())